@@ -0,0 +1,1195 @@
+let allData = [];
+let allTests = [];
+let allTestsLower = [];  // allTests lowercased once, for the test filter
+let allTestsHtml = [];  // allTests HTML-escaped once, for headers and tooltips
+let netidsLower = [];  // allData netids lowercased once, parallel to allData, for the monitor filter
+let testIndex = new Map();  // test name -> column in the matrices below
+let statusMatrix = new Uint8Array(0);  // row-major (monitor, test) status codes
+let flagMatrix = new Uint8Array(0);  // row-major (monitor, test) FLAG_* bits
+let currentData = [];
+let monitorOrders = {};  // sort key -> ascending Int32Array of indices into allData
+let invalidReasons = {};  // test name -> reason, for tests marked invalid
+let otherStatuses = new Map();  // row-major cell index -> raw status string, for STATUS_OTHER cells
+
+const MONITOR_SORT_KEYS = ['netid', 'pass_count', 'fail_count', 'timeout_count'];
+const STATUS_NAMES = ['N/A', 'PASS', 'FAIL', 'TIMEOUT', 'OTHER'];
+const STATUS_PASS = 1;
+const STATUS_FAIL = 2;
+const STATUS_TIMEOUT = 3;
+const STATUS_OTHER = 4;  // any other status string; the string itself is in otherStatuses
+const FLAG_RESOLVED = 1;
+const FLAG_TODO = 2;
+const FLAG_INVALID = 4;
+const FILTER_DEBOUNCE_MS = 120;
+const STREAM_RENDER_BATCH = 200;  // re-render after this many streamed monitors
+
+// Result glyphs, written into cells with textContent (never parsed as HTML)
+const SYMBOLS = {pass: '✓', fail: '✗', timeout: '⏱', todo: '📌', invalid: '⚠', unknown: '?'};
+
+// Size the typed-array matrices and lookups for a payload of nMonitors rows
+function beginMatrix(testNames, invalidTests, otherStatusPairs, nMonitors, orders) {
+    allTests = testNames;
+    allTestsLower = allTests.map(t => t.toLowerCase());
+    allTestsHtml = allTests.map(escapeHtml);
+    invalidReasons = invalidTests;
+    otherStatuses = new Map(otherStatusPairs);
+    testIndex = new Map(allTests.map((test, j) => [test, j]));
+    statusMatrix = new Uint8Array(nMonitors * allTests.length);
+    flagMatrix = new Uint8Array(nMonitors * allTests.length);
+    allData = [];
+    netidsLower = [];
+    monitorOrders = orders;
+    testOrderCache = {};
+}
+
+// Append one monitor: copy its status/flag bytes into the matrices and add the
+// per-monitor object the rest of the page works with
+function addMonitor(netid, passCount, failCount, timeoutCount, total, status, flags) {
+    const i = allData.length;
+    statusMatrix.set(status, i * allTests.length);
+    flagMatrix.set(flags, i * allTests.length);
+    netidsLower.push(netid.toLowerCase());
+    allData.push({
+        row: i,
+        netid: netid,
+        netid_html: escapeHtml(netid),
+        pass_count: passCount,
+        fail_count: failCount,
+        timeout_count: timeoutCount,
+        total: total
+    });
+}
+
+// Status string of the cell at row-major index k
+function cellStatus(k) {
+    return statusMatrix[k] === STATUS_OTHER ? otherStatuses.get(k) : STATUS_NAMES[statusMatrix[k]];
+}
+
+// CELL_STYLES index of the cell at row-major index k: status code in the low 3 bits, flags above
+function cellState(k) {
+    return statusMatrix[k] | (flagMatrix[k] << 3);
+}
+
+// One cell's result and annotation state, read from the matrices when its details are opened
+function cellResult(monitor, testName) {
+    const k = monitor.row * allTests.length + testIndex.get(testName);
+    return {
+        status: cellStatus(k),
+        is_resolved: (flagMatrix[k] & FLAG_RESOLVED) !== 0,
+        is_todo: (flagMatrix[k] & FLAG_TODO) !== 0,
+        is_invalid_test: (flagMatrix[k] & FLAG_INVALID) !== 0,
+        invalid_reason: invalidReasons[testName] || '',
+        netid: monitor.netid,
+        test_name: testName
+    };
+}
+
+// "0123..." digit string (one status code or flag set per test) -> bytes
+function decodeDigits(digits) {
+    const bytes = new Uint8Array(digits.length);
+    for (let j = 0; j < digits.length; j++) {
+        bytes[j] = digits.charCodeAt(j) - 48;
+    }
+    return bytes;
+}
+
+// The Arrow bundle is only needed when the server has pyarrow and sends Arrow IPC,
+// so it is fetched then rather than blocking every page load
+const ARROW_BUNDLE_URL = 'https://cdn.jsdelivr.net/npm/apache-arrow@17/Arrow.es2015.min.js';
+let arrowLoading = null;
+
+function loadArrow() {
+    if (!arrowLoading) {
+        arrowLoading = new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = ARROW_BUNDLE_URL;
+            script.onload = () => resolve(window.Arrow);
+            script.onerror = () => {
+                arrowLoading = null;
+                reject(new Error('Failed to load the Arrow library needed to read the data'));
+            };
+            document.head.appendChild(script);
+        });
+    }
+    return arrowLoading;
+}
+
+// Load the bootstrap payload: Arrow IPC in one go, or NDJSON (server without pyarrow)
+// parsed line by line so the first rows render before the download finishes
+async function loadBootstrap() {
+    const response = await fetch('/api/bootstrap');
+    if (!response.ok) {
+        throw new Error(`Failed to load data (HTTP ${response.status})`);
+    }
+
+    if ((response.headers.get('Content-Type') || '').startsWith('application/vnd.apache.arrow.stream')) {
+        const [arrow, buffer] = await Promise.all([loadArrow(), response.arrayBuffer()]);
+        const table = arrow.tableFromIPC(buffer);
+        const meta = table.schema.metadata;
+        const orders = {};
+        MONITOR_SORT_KEYS.forEach(key => {
+            orders[key] = table.getChild(`order_${key}`).toArray();
+        });
+        beginMatrix(JSON.parse(meta.get('test_names')), JSON.parse(meta.get('invalid_tests')),
+                    JSON.parse(meta.get('other_statuses')), table.numRows, orders);
+
+        const netids = table.getChild('netid');
+        const passCounts = table.getChild('pass_count').toArray();
+        const failCounts = table.getChild('fail_count').toArray();
+        const timeoutCounts = table.getChild('timeout_count').toArray();
+        const totals = table.getChild('total').toArray();
+        const status = table.getChild('status');
+        const flags = table.getChild('flags');
+        for (let i = 0; i < table.numRows; i++) {
+            addMonitor(netids.get(i), passCounts[i], failCounts[i], timeoutCounts[i], totals[i], status.get(i), flags.get(i));
+        }
+        return;
+    }
+
+    // First line is the header (tests, invalid reasons, other statuses, monitor count, sort orders);
+    // then one monitor per line
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let header = null;
+    let sinceRender = 0;
+    const handleLine = line => {
+        if (!line) return;
+        const row = JSON.parse(line);
+        if (header === null) {
+            header = row;
+            beginMatrix(row.test_names, row.invalid_tests, row.other_statuses, row.n_monitors, row.orders);
+            return;
+        }
+        addMonitor(row.netid, row.pass_count, row.fail_count, row.timeout_count, row.total,
+                   decodeDigits(row.status), decodeDigits(row.flags));
+        if (++sinceRender === STREAM_RENDER_BATCH) {
+            sinceRender = 0;
+            applyFilters();
+        }
+    };
+    for (;;) {
+        const {done, value} = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, {stream: true});
+        const lines = buffer.split('\n');
+        buffer = lines.pop();
+        lines.forEach(handleLine);
+    }
+    handleLine(buffer + decoder.decode());
+}
+
+// Filter and sort controls, looked up once rather than on every keystroke
+const monitorFilterInput = document.getElementById('monitorFilter');
+const testFilterInput = document.getElementById('testFilter');
+const sortMonitorsSelect = document.getElementById('sortMonitorsBy');
+const sortTestsSelect = document.getElementById('sortTestsBy');
+const sortOrderSelect = document.getElementById('sortOrder');
+
+// Save/restore filter state from localStorage
+function saveFilterState() {
+    const filterState = {
+        monitorFilter: monitorFilterInput.value,
+        testFilter: testFilterInput.value,
+        sortMonitorsBy: sortMonitorsSelect.value,
+        sortTestsBy: sortTestsSelect.value,
+        sortOrder: sortOrderSelect.value
+    };
+    localStorage.setItem('testVisualizerFilters', JSON.stringify(filterState));
+}
+
+function restoreFilterState() {
+    const saved = localStorage.getItem('testVisualizerFilters');
+    if (saved) {
+        try {
+            const filterState = JSON.parse(saved);
+            monitorFilterInput.value = filterState.monitorFilter || '';
+            testFilterInput.value = filterState.testFilter || '';
+            sortMonitorsSelect.value = filterState.sortMonitorsBy || 'netid';
+            sortTestsSelect.value = filterState.sortTestsBy || 'name';
+            sortOrderSelect.value = filterState.sortOrder || 'desc';
+        } catch (e) {
+            console.error('Failed to restore filter state:', e);
+        }
+    }
+}
+
+let detailRequest = 0;  // bumped per modal open, so late responses can tell they are stale
+
+async function openDetailModal(netid, testName, resultData) {
+    const modal = document.getElementById('detailModal');
+    const modalTitle = document.getElementById('modalTitle');
+    const modalContent = document.getElementById('modalContent');
+
+    // Set title
+    modalTitle.textContent = `${netid} - ${testName}`;
+
+    // Show loading state
+    modalContent.innerHTML = `
+        <div class="flex items-center justify-center py-16">
+            <div class="text-center">
+                <div class="text-6xl mb-4">⏳</div>
+                <div class="text-xl text-gray-600">Loading details...</div>
+            </div>
+        </div>
+    `;
+
+    // Show modal immediately
+    modal.classList.remove('hidden');
+    document.body.style.overflow = 'hidden';
+
+    // Fetch detailed data from API; the (larger) source files load in parallel and fill in after
+    const request = ++detailRequest;
+    const path = `${encodeURIComponent(netid)}/${encodeURIComponent(testName)}`;
+    const sourcePromise = fetch(`/api/source/${path}`)
+        .then(response => response.ok ? response.json() : null)
+        .catch(() => null);
+    try {
+        const response = await fetch(`/api/test_details/${path}`);
+        if (!response.ok) {
+            throw new Error('Failed to load details');
+        }
+        const details = await response.json();
+        if (request !== detailRequest) return;  // Another cell was opened meanwhile
+
+        // Build content with loaded data
+        const status = resultData ? resultData.status : 'N/A';
+        const duration = details.duration ? details.duration.toFixed(3) : 'N/A';
+        const exitCode = details.exit_code !== null ? details.exit_code : 'N/A';
+        const error = details.error ? details.error : 'None';
+        const stdout = details.stdout ? details.stdout : '(empty)';
+        const startTime = details.start_time ? formatTime(details.start_time) : 'N/A';
+        const endTime = details.end_time ? formatTime(details.end_time) : 'N/A';
+        const verification = details.verification || '';
+
+    // Determine status color and icon
+    let statusClass = 'bg-gray-100 text-gray-700';
+    let statusIcon = SYMBOLS.unknown;
+    if (status === 'PASS') {
+        statusClass = 'bg-green-100 text-green-700 border-l-4 border-green-500';
+        statusIcon = SYMBOLS.pass;
+    } else if (status === 'FAIL') {
+        statusClass = 'bg-red-100 text-red-700 border-l-4 border-red-500';
+        statusIcon = SYMBOLS.fail;
+    } else if (status === 'TIMEOUT') {
+        statusClass = 'bg-orange-100 text-orange-700 border-l-4 border-orange-500';
+        statusIcon = SYMBOLS.timeout;
+    }
+
+    modalContent.innerHTML = `
+        <div class="space-y-6">
+            <!-- Status Banner -->
+            <div class="${statusClass} rounded-lg p-4">
+                <div class="flex items-center gap-3">
+                    <span class="text-4xl">${statusIcon}</span>
+                    <div>
+                        <h3 class="text-2xl font-bold">${escapeHtml(status)}</h3>
+                        <p class="text-sm opacity-75">Test execution status</p>
+                    </div>
+                </div>
+            </div>
+
+            <!-- Execution Details Grid -->
+            <div class="grid grid-cols-1 md:grid-cols-2 gap-4">
+                <div class="bg-gray-50 rounded-lg p-4">
+                    <h4 class="text-xs font-semibold text-gray-500 uppercase mb-1">Monitor (NetID)</h4>
+                    <p class="text-lg font-mono font-bold text-primary">${escapeHtml(netid)}</p>
+                </div>
+
+                <div class="bg-gray-50 rounded-lg p-4">
+                    <h4 class="text-xs font-semibold text-gray-500 uppercase mb-1">Test Case</h4>
+                    <p class="text-lg font-semibold text-gray-700">${escapeHtml(testName)}</p>
+                </div>
+
+                <div class="bg-gray-50 rounded-lg p-4">
+                    <h4 class="text-xs font-semibold text-gray-500 uppercase mb-1">Duration</h4>
+                    <p class="text-2xl font-bold text-blue-600">${duration}s</p>
+                </div>
+
+                <div class="bg-gray-50 rounded-lg p-4">
+                    <h4 class="text-xs font-semibold text-gray-500 uppercase mb-1">Exit Code</h4>
+                    <p class="text-2xl font-bold text-gray-700">${exitCode}</p>
+                </div>
+
+                <div class="bg-gray-50 rounded-lg p-4">
+                    <h4 class="text-xs font-semibold text-gray-500 uppercase mb-1">Start Time</h4>
+                    <p class="text-sm text-gray-700">${startTime}</p>
+                </div>
+
+                <div class="bg-gray-50 rounded-lg p-4">
+                    <h4 class="text-xs font-semibold text-gray-500 uppercase mb-1">End Time</h4>
+                    <p class="text-sm text-gray-700">${endTime}</p>
+                </div>
+            </div>
+
+            <!-- Error Message -->
+            ${error !== 'None' ? `
+            <div class="bg-red-50 border-l-4 border-red-500 rounded-lg p-4">
+                <h4 class="text-sm font-semibold text-red-700 uppercase mb-2">Error Message</h4>
+                <pre class="text-sm text-red-900 whitespace-pre-wrap font-mono bg-white rounded p-3 overflow-x-auto" id="detailError"></pre>
+            </div>
+            ` : ''}
+
+            <!-- ChatGPT Verification Comment -->
+            ${verification ? `
+            <div class="bg-purple-50 border-l-4 border-purple-500 rounded-lg p-4">
+                <div class="flex items-center gap-2 mb-3">
+                    <span class="text-2xl">🤖</span>
+                    <h4 class="text-sm font-semibold text-purple-700 uppercase">ChatGPT Verification Analysis</h4>
+                </div>
+                <div class="text-sm text-gray-800 whitespace-pre-wrap bg-white rounded p-4 overflow-x-auto max-h-96 leading-relaxed" id="detailVerification"></div>
+            </div>
+            ` : ''}
+
+            <!-- Standard Output -->
+            <div class="bg-blue-50 border-l-4 border-blue-500 rounded-lg p-4">
+                <h4 class="text-sm font-semibold text-blue-700 uppercase mb-2">Standard Output</h4>
+                <pre class="text-sm text-gray-800 whitespace-pre-wrap font-mono bg-white rounded p-3 overflow-x-auto max-h-96" id="detailStdout"></pre>
+            </div>
+
+            <!-- Reference Monitor Source -->
+            <div class="bg-gray-50 border-l-4 border-gray-500 rounded-lg p-4">
+                <h4 class="text-sm font-semibold text-gray-700 uppercase mb-2">Reference Monitor Source</h4>
+                <div class="text-xs text-gray-500 mb-2">${details.monitor_path ? escapeHtml(details.monitor_path) : 'Path: N/A'}</div>
+                <pre class="text-xs text-gray-800 whitespace-pre-wrap font-mono bg-white rounded p-3 overflow-x-auto max-h-96" id="monitorSource">Loading...</pre>
+            </div>
+
+            <!-- Attack Test Source -->
+            <div class="bg-gray-50 border-l-4 border-gray-500 rounded-lg p-4">
+                <h4 class="text-sm font-semibold text-gray-700 uppercase mb-2">Attack Test Source</h4>
+                <div class="text-xs text-gray-500 mb-2">${details.attack_path ? escapeHtml(details.attack_path) : 'Path: N/A'}</div>
+                <pre class="text-xs text-gray-800 whitespace-pre-wrap font-mono bg-white rounded p-3 overflow-x-auto max-h-96" id="attackSource">Loading...</pre>
+            </div>
+
+            <!-- Actions -->
+            <div class="space-y-4">
+                <!-- Annotation Actions (only show for failed tests, not timeouts) -->
+                ${status === 'FAIL' && !resultData.is_invalid_test ? `
+                <div class="bg-gray-100 rounded-lg p-4">
+                    <h4 class="text-sm font-semibold text-gray-700 mb-3">Mark as:</h4>
+                    <div class="flex gap-3 flex-wrap">
+                        <button onclick="markAsResolved('${netid}', '${testName}', ${!resultData.is_resolved})" 
+                                class="px-4 py-2 ${resultData.is_resolved ? 'bg-gray-400' : 'bg-blue-500 hover:bg-blue-600'} text-white font-semibold rounded-lg transition">
+                            ${resultData.is_resolved ? `${SYMBOLS.pass} Resolved` : 'Mark Resolved'}
+                        </button>
+                        <button onclick="markAsTodo('${netid}', '${testName}', ${!resultData.is_todo})" 
+                                class="px-4 py-2 ${resultData.is_todo ? 'bg-gray-400' : 'bg-orange-500 hover:bg-orange-600'} text-white font-semibold rounded-lg transition">
+                            ${resultData.is_todo ? `${SYMBOLS.todo} TODO` : 'Mark TODO'}
+                        </button>
+                    </div>
+                </div>
+                ` : ''}
+
+                <!-- Invalid Test Action -->
+                <div class="bg-gray-100 rounded-lg p-4">
+                    <h4 class="text-sm font-semibold text-gray-700 mb-3">Test Validity:</h4>
+                    ${resultData.is_invalid_test ? `
+                        <div class="mb-3">
+                            <div class="text-sm text-yellow-700 bg-yellow-50 rounded p-3 mb-2">
+                                <strong>${SYMBOLS.invalid} Invalid Test</strong><br>
+                                Reason: ${escapeHtml(resultData.invalid_reason || 'No reason provided')}
+                            </div>
+                            <button onclick="markTestAsInvalid('${testName}', false)" 
+                                    class="px-4 py-2 bg-green-500 hover:bg-green-600 text-white font-semibold rounded-lg transition">
+                                Mark as Valid
+                            </button>
+                        </div>
+                    ` : `
+                        <button onclick="promptMarkTestAsInvalid('${testName}')" 
+                                class="px-4 py-2 bg-yellow-500 hover:bg-yellow-600 text-white font-semibold rounded-lg transition">
+                            Mark Entire Test as Invalid
+                        </button>
+                    `}
+                </div>
+
+                <!-- Close Button -->
+                <div class="flex justify-end">
+                    <button onclick="closeDetailModal()" class="px-6 py-2 bg-gray-500 hover:bg-gray-600 text-white font-semibold rounded-lg transition">
+                        Close
+                    </button>
+                </div>
+            </div>
+        </div>
+    `;
+
+        // Large text blocks go in as textContent, which needs no HTML escaping
+        if (error !== 'None') document.getElementById('detailError').textContent = error;
+        if (verification) document.getElementById('detailVerification').textContent = verification;
+        document.getElementById('detailStdout').textContent = stdout;
+
+        const source = await sourcePromise;
+        if (request !== detailRequest) return;
+        document.getElementById('monitorSource').textContent = (source && source.monitor_code) || 'N/A';
+        document.getElementById('attackSource').textContent = (source && source.attack_code) || 'N/A';
+    } catch (error) {
+        if (request !== detailRequest) return;
+        // Show error state
+        modalContent.innerHTML = `
+            <div class="flex items-center justify-center py-16">
+                <div class="text-center">
+                    <div class="text-6xl mb-4">❌</div>
+                    <div class="text-xl text-red-600 mb-4">Failed to load details</div>
+                    <div class="text-sm text-gray-600">${escapeHtml(error.message)}</div>
+                    <button onclick="closeDetailModal()" class="mt-6 px-6 py-2 bg-gray-500 hover:bg-gray-600 text-white font-semibold rounded-lg transition">
+                        Close
+                    </button>
+                </div>
+            </div>
+        `;
+    }
+}
+
+function closeDetailModal(event) {
+    // Only close if clicking outside the modal or close button
+    if (!event || event.target.id === 'detailModal' || event.type === 'undefined') {
+        const modal = document.getElementById('detailModal');
+        modal.classList.add('hidden');
+        document.body.style.overflow = 'auto';
+    }
+}
+
+// Close modal on Escape key
+document.addEventListener('keydown', function(event) {
+    if (event.key === 'Escape') {
+        closeDetailModal();
+    }
+});
+
+function updateStats(data) {
+    const totalMonitors = data.length;
+    const totalPass = data.reduce((sum, m) => sum + m.pass_count, 0);
+    const totalFail = data.reduce((sum, m) => sum + m.fail_count, 0);
+    const totalTimeout = data.reduce((sum, m) => sum + m.timeout_count, 0);
+
+    document.getElementById('stats').innerHTML = `
+        <div class="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-6">
+            <div class="bg-blue-50 rounded-xl p-6 border-l-4 border-blue-500 shadow-sm hover:shadow-md transition-shadow">
+                <div class="text-xs font-semibold text-gray-600 uppercase tracking-wide mb-2">Monitors</div>
+                <div class="text-4xl font-bold text-blue-600">${totalMonitors}</div>
+            </div>
+            <div class="bg-green-50 rounded-xl p-6 border-l-4 border-green-500 shadow-sm hover:shadow-md transition-shadow">
+                <div class="text-xs font-semibold text-gray-600 uppercase tracking-wide mb-2">Total Passes</div>
+                <div class="text-4xl font-bold text-green-600">${totalPass}</div>
+            </div>
+            <div class="bg-red-50 rounded-xl p-6 border-l-4 border-red-500 shadow-sm hover:shadow-md transition-shadow">
+                <div class="text-xs font-semibold text-gray-600 uppercase tracking-wide mb-2">Total Failures</div>
+                <div class="text-4xl font-bold text-red-600">${totalFail}</div>
+            </div>
+            <div class="bg-orange-50 rounded-xl p-6 border-l-4 border-orange-500 shadow-sm hover:shadow-md transition-shadow">
+                <div class="text-xs font-semibold text-gray-600 uppercase tracking-wide mb-2">Total Timeouts</div>
+                <div class="text-4xl font-bold text-orange-600">${totalTimeout}</div>
+            </div>
+        </div>
+    `;
+}
+
+function formatTime(isoString) {
+    if (!isoString) return 'N/A';
+    const date = new Date(isoString);
+    return date.toLocaleString();
+}
+
+// Short strings (names, paths, reasons) recur, so they are cached, least recently used
+// evicted first; large blobs like stdout or source code are escaped without being remembered
+const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#039;'};
+const ESCAPE_CACHE_MAX_LENGTH = 256;
+const ESCAPE_CACHE_SIZE = 512;
+const escapeCache = new Map();
+
+function escapeHtml(text) {
+    if (!text) return '';
+    let escaped = escapeCache.get(text);
+    if (escaped !== undefined) {
+        // Map keeps insertion order, so re-inserting marks the entry most recently used
+        escapeCache.delete(text);
+        escapeCache.set(text, escaped);
+        return escaped;
+    }
+    escaped = text.replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
+    if (text.length <= ESCAPE_CACHE_MAX_LENGTH) {
+        if (escapeCache.size >= ESCAPE_CACHE_SIZE) {
+            escapeCache.delete(escapeCache.keys().next().value);
+        }
+        escapeCache.set(text, escaped);
+    }
+    return escaped;
+}
+
+// Last calculateTestStats result, keyed on the identity of its inputs
+let statsCache = {dataRef: null, testsRef: null, stats: null};
+
+function calculateTestStats(data, testsToShow) {
+    if (statsCache.dataRef === data && statsCache.testsRef === testsToShow) {
+        return statsCache.stats;
+    }
+
+    // One linear pass over the status matrix; counts[code * nTests + j] tallies test column j
+    const nTests = allTests.length;
+    const counts = new Uint32Array(STATUS_NAMES.length * nTests);
+    const columns = testsToShow === allTests ? null : Int32Array.from(testsToShow, test => testIndex.get(test));
+    for (const monitor of data) {
+        const base = monitor.row * nTests;
+        if (columns === null) {
+            for (let j = 0; j < nTests; j++) {
+                counts[statusMatrix[base + j] * nTests + j]++;
+            }
+        } else {
+            for (const j of columns) {
+                counts[statusMatrix[base + j] * nTests + j]++;
+            }
+        }
+    }
+
+    // Per-status count arrays, indexed by testIndex
+    const testStats = {
+        pass_count: counts.subarray(STATUS_PASS * nTests, (STATUS_PASS + 1) * nTests),
+        fail_count: counts.subarray(STATUS_FAIL * nTests, (STATUS_FAIL + 1) * nTests),
+        timeout_count: counts.subarray(STATUS_TIMEOUT * nTests, (STATUS_TIMEOUT + 1) * nTests),
+        total: data.length
+    };
+
+    statsCache = {dataRef: data, testsRef: testsToShow, stats: testStats};
+    return testStats;
+}
+
+// Every test sorted by a count over all monitors, per `${sortBy}_${sortOrder}`.
+// Keyed on allData.length too, since monitors arrive incrementally when streamed.
+let testOrderCache = {};
+
+function sortTests(testsToShow, testStats, sortBy, sortOrder) {
+    if (sortBy === 'name') {
+        // Already sorted by name
+        return testsToShow;
+    }
+
+    // No monitor filter: the counts are the same every time, so reuse the full order and
+    // keep just the tests being shown (the sort is stable, so this equals sorting the subset)
+    if (testStats.total === allData.length) {
+        const key = `${sortBy}_${sortOrder}`;
+        let cached = testOrderCache[key];
+        if (!cached || cached.n !== allData.length) {
+            const fullStats = testsToShow === allTests ? testStats : calculateTestStats(allData, allTests);
+            cached = testOrderCache[key] = {n: allData.length, order: sortByCount(allTests, fullStats[sortBy], sortOrder)};
+        }
+        if (testsToShow === allTests) {
+            return cached.order;
+        }
+        const shown = new Uint8Array(allTests.length);
+        testsToShow.forEach(test => { shown[testIndex.get(test)] = 1; });
+        return cached.order.filter(test => shown[testIndex.get(test)]);
+    }
+
+    return sortByCount(testsToShow, testStats[sortBy], sortOrder);
+}
+
+function sortByCount(testsToShow, counts, sortOrder) {
+    const sorted = [...testsToShow].sort((a, b) => {
+        const statA = counts[testIndex.get(a)];
+        const statB = counts[testIndex.get(b)];
+
+        if (sortOrder === 'desc') {
+            return statB - statA;
+        } else {
+            return statA - statB;
+        }
+    });
+
+    return sorted;
+}
+
+// Virtualization: rows and test columns outside the viewport (minus overscan) are replaced by spacers
+const ROW_OVERSCAN = 10;
+const DEFAULT_ROW_HEIGHT = 36;
+const COL_OVERSCAN = 5;
+const COL_WIDTH = 50;  // keep in sync with the width in the page's headCellTpl
+let tableView = {data: [], testsToShow: [], testStats: {}, rowHeight: 0, labelWidth: 0, start: -1, end: -1, colStart: -1, colEnd: -1};
+let scrollFrame = null;
+
+// Header, row and cell templates cloned per render instead of re-parsing HTML strings
+const rowTemplate = document.getElementById('rowTpl');
+const cellTemplate = document.getElementById('cellTpl');
+const headRowTemplate = document.getElementById('headRowTpl');
+const headCellTemplate = document.getElementById('headCellTpl');
+
+// Floating tooltips shared by every matrix cell / monitor label
+const cellTip = document.getElementById('cellTip');
+let cellTipTarget = null;
+const monitorTip = document.getElementById('monitorTip');
+let monitorTipTarget = null;
+const testTip = document.getElementById('testTip');
+let testTipTarget = null;
+
+// Cell data-state/symbol and tooltip fragments for every cellState() value
+// (status code | flag bits << 3), built once. Colors live in the page's .cell[data-state] rules.
+const CELL_STYLES = Array.from({length: 64}, (_, state) => {
+    const status = STATUS_NAMES[state & 7];
+    const isResolved = (state >> 3) & FLAG_RESOLVED;
+    const isTodo = (state >> 3) & FLAG_TODO;
+    const isInvalidTest = (state >> 3) & FLAG_INVALID;
+
+    let cellState = 'na';
+    let symbol = SYMBOLS.unknown;
+
+    // If test is invalid, always show yellow regardless of PASS/FAIL
+    if (isInvalidTest) {
+        cellState = 'invalid';
+        symbol = SYMBOLS.invalid;
+    } else if (status === 'PASS') {
+        cellState = 'pass';
+        symbol = SYMBOLS.pass;
+    } else if (status === 'TIMEOUT') {
+        // Timeouts show blue by default (expected behavior)
+        cellState = 'timeout';
+        symbol = SYMBOLS.timeout;
+    } else if (status === 'FAIL') {
+        // Failed tests - check if resolved or TODO
+        if (isResolved) {
+            cellState = 'fail-resolved';
+            symbol = SYMBOLS.pass;
+        } else if (isTodo) {
+            cellState = 'fail-todo';
+            symbol = SYMBOLS.todo;
+        } else {
+            cellState = 'fail';
+            symbol = SYMBOLS.fail;
+        }
+    } else if (status === 'OTHER') {
+        cellState = 'other';
+    }
+
+    // Status line for the tooltip (null for OTHER: buildCellTooltip shows that cell's own string)
+    let tipStatus = status === 'OTHER' ? null : `<span class="text-gray-400">${status}</span>`;
+    if (status === 'PASS') {
+        tipStatus = `<span class="text-green-400 font-bold">${SYMBOLS.pass} PASS</span>`;
+    } else if (status === 'FAIL') {
+        if (isResolved) {
+            tipStatus = `<span class="text-blue-400 font-bold">${SYMBOLS.pass} FAIL (Resolved)</span>`;
+        } else if (isTodo) {
+            tipStatus = `<span class="text-orange-400 font-bold">${SYMBOLS.todo} FAIL (TODO)</span>`;
+        } else {
+            tipStatus = `<span class="text-red-400 font-bold">${SYMBOLS.fail} FAIL</span>`;
+        }
+    } else if (status === 'TIMEOUT') {
+        tipStatus = `<span class="text-blue-400 font-bold">${SYMBOLS.timeout} TIMEOUT</span>`;
+    }
+
+    return {
+        state: cellState,
+        sym: symbol,
+        tipStatus: tipStatus,
+        tipBanner: isInvalidTest ? `<div class="bg-yellow-600 text-white px-2 py-1 rounded text-xs mt-1 mb-1">${SYMBOLS.invalid} Invalid Test</div>` : ''
+    };
+});
+
+function updateTable(data, testFilter = '', sortTestsBy = 'name', sortOrder = 'desc') {
+    const table = document.getElementById('dataTable');
+
+    if (data.length === 0) {
+        table.innerHTML = '<tr><td class="text-center py-16 text-gray-400 text-xl" colspan="10">No data matches your filters</td></tr>';
+        tableView.data = [];
+        return;
+    }
+
+    // Filter tests if test filter is applied
+    let testsToShow = allTests;
+    if (testFilter) {
+        testsToShow = allTests.filter((t, j) => allTestsLower[j].includes(testFilter));
+    }
+
+    // Stats are keyed by test name, so one pass serves both sorting and tooltips
+    const testStats = calculateTestStats(data, testsToShow);
+    testsToShow = sortTests(testsToShow, testStats, sortTestsBy, sortOrder);
+
+    const thead = document.createElement('thead');
+    thead.className = 'bg-gray-100 sticky top-0';
+    const tbody = document.createElement('tbody');
+    tbody.className = 'divide-y divide-gray-200 text-xs';
+    table.replaceChildren(thead, tbody);
+
+    // Only the rows and columns inside the scroll viewport are rendered; see renderWindow()
+    tableView = {
+        data: data,
+        testsToShow: testsToShow,
+        testStats: testStats,
+        rowHeight: tableView.rowHeight,
+        labelWidth: tableView.labelWidth,
+        start: -1,
+        end: -1,
+        colStart: -1,
+        colEnd: -1
+    };
+    renderWindow(true);
+}
+
+// Fixed-width spacer cell standing in for the test columns left/right of the window
+function createSpacerCell(columns, tag = 'td') {
+    const td = document.createElement(tag);
+    const width = columns * COL_WIDTH;
+    td.style.cssText = `width: ${width}px; min-width: ${width}px; padding: 0; border: 0;`;
+    return td;
+}
+
+// Spacer row standing in for the rows above/below the window
+function createSpacerRow(height, colspan) {
+    const tr = document.createElement('tr');
+    const td = document.createElement('td');
+    td.colSpan = colspan;
+    td.style.cssText = `height: ${height}px; padding: 0; border: 0;`;
+    tr.appendChild(td);
+    return tr;
+}
+
+// Header row for the tests inside the column window, cloned from templates like the body rows
+function buildHeaderRow(testsToShow, colStart, colEnd) {
+    const tr = headRowTemplate.content.firstElementChild.cloneNode(true);
+    tr.appendChild(createSpacerCell(colStart, 'th'));
+
+    for (let j = colStart; j < colEnd; j++) {
+        // Its hover panel is rendered into #testTip by the delegated mouseover handler
+        const th = headCellTemplate.content.firstElementChild.cloneNode(true);
+        th.dataset.h = j;
+        th.textContent = testsToShow[j].replace('.r2py', '').replace('test', 't');
+        tr.appendChild(th);
+    }
+
+    tr.appendChild(createSpacerCell(testsToShow.length - colEnd, 'th'));
+    return tr;
+}
+
+// Hover text for one matrix cell, rendered into the shared #cellTip on demand;
+// the names are escaped at load time and the rest comes preformatted from CELL_STYLES
+function buildCellTooltip(k, monitor, col) {
+    const style = CELL_STYLES[cellState(k)];
+    const tipStatus = style.tipStatus !== null ? style.tipStatus
+        : `<span class="text-gray-400">${escapeHtml(cellStatus(k))}</span>`;
+    return `<div class="font-bold text-yellow-300 mb-2">📋 ${allTestsHtml[col]}</div>` +
+        `<div class="text-xs text-gray-300 mb-2">Monitor: ${monitor.netid_html}</div>` +
+        `<div class="border-t border-gray-700 pt-2 mb-2"></div>` +
+        `Status: ${tipStatus}<br>${style.tipBanner}`;
+}
+
+function showCellTooltip(td) {
+    const monitor = tableView.data[+td.parentNode.dataset.n];
+    const col = testIndex.get(tableView.testsToShow[+td.dataset.t]);
+    const k = monitor.row * allTests.length + col;
+    const rect = td.getBoundingClientRect();
+    cellTip.firstElementChild.innerHTML = buildCellTooltip(k, monitor, col);
+    cellTip.style.left = `${rect.left + rect.width / 2}px`;
+    cellTip.style.top = `${rect.top - 8}px`;
+    cellTip.classList.remove('hidden');
+    cellTipTarget = td;
+}
+
+function hideCellTooltip() {
+    cellTip.classList.add('hidden');
+    cellTipTarget = null;
+}
+
+function showMonitorTooltip(label) {
+    const monitor = tableView.data[+label.parentNode.dataset.n];
+    const rect = label.getBoundingClientRect();
+    monitorTip.firstElementChild.innerHTML = `
+        <strong>Monitor: ${monitor.netid_html}</strong><br>
+        <span class="text-green-400">${SYMBOLS.pass} Pass: ${monitor.pass_count}</span><br>
+        <span class="text-red-400">${SYMBOLS.fail} Fail: ${monitor.fail_count}</span><br>
+        <span class="text-orange-400">${SYMBOLS.timeout} Timeout: ${monitor.timeout_count}</span><br>
+        <strong>Total: ${monitor.total}</strong>
+    `;
+    monitorTip.style.left = `${rect.right + 8}px`;
+    monitorTip.style.top = `${rect.top + rect.height / 2}px`;
+    monitorTip.classList.remove('hidden');
+    monitorTipTarget = label;
+}
+
+function hideMonitorTooltip() {
+    monitorTip.classList.add('hidden');
+    monitorTipTarget = null;
+}
+
+function showTestTooltip(th) {
+    const test = tableView.testsToShow[+th.dataset.h];
+    const col = testIndex.get(test);
+    const testStats = tableView.testStats;
+    const rect = th.getBoundingClientRect();
+    testTip.innerHTML = `
+        <strong>${allTestsHtml[col]}</strong><br>
+        Pass: ${testStats.pass_count[col]}<br>
+        Fail: ${testStats.fail_count[col]}<br>
+        Timeout: ${testStats.timeout_count[col]}<br>
+        Total: ${testStats.total}
+    `;
+    testTip.style.left = `${rect.left + rect.width / 2}px`;
+    testTip.style.top = `${rect.bottom + 8}px`;
+    testTip.classList.remove('hidden');
+    testTipTarget = th;
+}
+
+function hideTestTooltip() {
+    testTip.classList.add('hidden');
+    testTipTarget = null;
+}
+
+function hideTooltips() {
+    hideCellTooltip();
+    hideMonitorTooltip();
+    hideTestTooltip();
+}
+
+function buildRow(monitor, n, testsToShow, colStart, colEnd) {
+    const tr = rowTemplate.content.firstElementChild.cloneNode(true);
+    tr.dataset.n = n;
+
+    // NetID cell; its hover panel is rendered into #monitorTip by the delegated mouseover handler
+    tr.firstElementChild.textContent = monitor.netid;
+    tr.appendChild(createSpacerCell(colStart));
+
+    // Show the tests inside the column window as matrix cells
+    const base = monitor.row * allTests.length;
+    for (let j = colStart; j < colEnd; j++) {
+        // Cell look comes straight from the status code and flag bits
+        const k = base + testIndex.get(testsToShow[j]);
+        const style = CELL_STYLES[cellState(k)];
+
+        const td = cellTemplate.content.firstElementChild.cloneNode(true);
+        td.dataset.t = j;
+        const box = td.firstElementChild;
+        box.dataset.state = style.state;
+        box.textContent = style.sym;
+        tr.appendChild(td);
+    }
+
+    tr.appendChild(createSpacerCell(testsToShow.length - colEnd));
+    return tr;
+}
+
+function renderWindow(force = false) {
+    const view = tableView;
+    const table = document.getElementById('dataTable');
+    if (!table.tBodies.length || view.data.length === 0) return;
+
+    // Visible rows plus overscan, from the container's vertical scroll position
+    const container = document.getElementById('tableContainer');
+    const rowHeight = view.rowHeight || DEFAULT_ROW_HEIGHT;
+    const n = view.data.length;
+    const start = Math.min(n, Math.max(0, Math.floor(container.scrollTop / rowHeight) - ROW_OVERSCAN));
+    // The container only grows to its max-height once rows exist, so size the window for the full page height
+    const viewportHeight = Math.max(container.clientHeight, window.innerHeight);
+    const end = Math.min(n, start + Math.ceil(viewportHeight / rowHeight) + 2 * ROW_OVERSCAN);
+
+    // Visible test columns plus overscan, from the horizontal scroll position
+    const colCount = view.testsToShow.length;
+    const colStart = Math.min(colCount, Math.max(0, Math.floor((container.scrollLeft - view.labelWidth) / COL_WIDTH) - COL_OVERSCAN));
+    const colEnd = Math.min(colCount, colStart + Math.ceil(container.clientWidth / COL_WIDTH) + 2 * COL_OVERSCAN);
+
+    const columnsChanged = colStart !== view.colStart || colEnd !== view.colEnd;
+    if (!force && !columnsChanged && start === view.start && end === view.end) return;
+    const prevStart = view.start;
+    const prevEnd = view.end;
+    view.start = start;
+    view.end = end;
+    view.colStart = colStart;
+    view.colEnd = colEnd;
+
+    if (force || columnsChanged) {
+        table.tHead.replaceChildren(buildHeaderRow(view.testsToShow, colStart, colEnd));
+    }
+
+    const tbody = table.tBodies[0];
+    if (!force && !columnsChanged && start < prevEnd && prevStart < end) {
+        // Plain vertical scroll: keep the rows still in view and build only those scrolled in
+        shiftRowWindow(tbody, prevStart, prevEnd, start, end, n * rowHeight, rowHeight);
+        return;
+    }
+
+    // Clone the row template into a fragment and swap the whole body in one operation
+    const colspan = colEnd - colStart + 3;
+    const frag = document.createDocumentFragment();
+    frag.appendChild(createSpacerRow(start * rowHeight, colspan));
+    for (let i = start; i < end; i++) {
+        frag.appendChild(buildRow(view.data[i], i, view.testsToShow, colStart, colEnd));
+    }
+    frag.appendChild(createSpacerRow((n - end) * rowHeight, colspan));
+    tbody.replaceChildren(frag);
+
+    // Measure the real row height and monitor column width once, then re-render with accurate spacers
+    if (!view.rowHeight && end > start) {
+        const firstRow = tbody.rows[1];
+        if (firstRow.offsetHeight) {
+            view.rowHeight = firstRow.offsetHeight;
+            view.labelWidth = firstRow.cells[0].offsetWidth;
+            renderWindow(true);
+        }
+    }
+}
+
+// Move the rendered row window from [prevStart, prevEnd) to the overlapping [start, end)
+function shiftRowWindow(tbody, prevStart, prevEnd, start, end, totalHeight, rowHeight) {
+    const view = tableView;
+    const topSpacer = tbody.rows[0];
+    const bottomSpacer = tbody.rows[tbody.rows.length - 1];
+
+    // Drop rows that scrolled out at either end
+    for (let i = prevStart; i < start; i++) {
+        topSpacer.nextElementSibling.remove();
+    }
+    for (let i = end; i < prevEnd; i++) {
+        tbody.rows[tbody.rows.length - 2].remove();
+    }
+
+    // Add rows that scrolled in, each side in one insertion
+    if (start < prevStart) {
+        const frag = document.createDocumentFragment();
+        for (let i = start; i < prevStart; i++) {
+            frag.appendChild(buildRow(view.data[i], i, view.testsToShow, view.colStart, view.colEnd));
+        }
+        tbody.insertBefore(frag, topSpacer.nextElementSibling);
+    }
+    if (end > prevEnd) {
+        const frag = document.createDocumentFragment();
+        for (let i = prevEnd; i < end; i++) {
+            frag.appendChild(buildRow(view.data[i], i, view.testsToShow, view.colStart, view.colEnd));
+        }
+        tbody.insertBefore(frag, bottomSpacer);
+    }
+
+    topSpacer.firstElementChild.style.height = `${start * rowHeight}px`;
+    bottomSpacer.firstElementChild.style.height = `${totalHeight - end * rowHeight}px`;
+}
+
+function scheduleRenderWindow() {
+    if (scrollFrame !== null) return;
+    scrollFrame = requestAnimationFrame(() => {
+        scrollFrame = null;
+        renderWindow();
+    });
+}
+
+function applyFilters() {
+    const monitorFilter = monitorFilterInput.value.toLowerCase();
+    const testFilter = testFilterInput.value.toLowerCase();
+    const sortMonitorsBy = sortMonitorsSelect.value;
+    const sortTestsBy = sortTestsSelect.value;
+    const sortOrder = sortOrderSelect.value;
+
+    // Save filter state to localStorage
+    saveFilterState();
+
+    // Walk the server's precomputed order (backwards for descending) and filter by monitor
+    const filtered = [];
+    const order = monitorOrders[sortMonitorsBy] || monitorOrders.netid;
+    const n = order.length;
+
+    // Filter by test (no monitor is shown if no test matches the filter)
+    const anyTestMatches = !testFilter || allTestsLower.some(t => t.includes(testFilter));
+
+    // Only the flat netidsLower strings are read while filtering; monitor objects are
+    // touched just for the rows that are kept
+    const loaded = allData.length;
+    for (let k = 0; anyTestMatches && k < n; k++) {
+        const i = order[sortOrder === 'asc' ? k : n - 1 - k];
+        if (i >= loaded) {
+            continue;  // Not streamed in yet
+        }
+        if (monitorFilter && !netidsLower[i].includes(monitorFilter)) {
+            continue;
+        }
+        filtered.push(allData[i]);
+    }
+
+    currentData = filtered;
+    updateStats(filtered);
+    updateTable(filtered, testFilter, sortTestsBy, sortOrder);
+}
+
+// Coalesce bursts of keystrokes into a single applyFilters pass
+let filterTimer = null;
+function scheduleApplyFilters() {
+    clearTimeout(filterTimer);
+    filterTimer = setTimeout(applyFilters, FILTER_DEBOUNCE_MS);
+}
+
+// Event listeners
+monitorFilterInput.addEventListener('input', scheduleApplyFilters);
+testFilterInput.addEventListener('input', scheduleApplyFilters);
+sortMonitorsSelect.addEventListener('change', applyFilters);
+sortTestsSelect.addEventListener('change', applyFilters);
+sortOrderSelect.addEventListener('change', applyFilters);
+document.getElementById('tableContainer').addEventListener('scroll', scheduleRenderWindow);
+// Cells carry only their test index (data-t) and rows their monitor index (data-n)
+document.getElementById('dataTable').addEventListener('click', event => {
+    const td = event.target.closest('td[data-t]');
+    if (!td) return;
+    const monitor = tableView.data[+td.parentNode.dataset.n];
+    const test = tableView.testsToShow[+td.dataset.t];
+    openDetailModal(monitor.netid, test, cellResult(monitor, test));
+});
+document.getElementById('dataTable').addEventListener('mouseover', event => {
+    const td = event.target.closest('td[data-t]');
+    if (td !== cellTipTarget) {
+        td ? showCellTooltip(td) : hideCellTooltip();
+    }
+    const label = event.target.closest('td[data-label]');
+    if (label !== monitorTipTarget) {
+        label ? showMonitorTooltip(label) : hideMonitorTooltip();
+    }
+    const th = event.target.closest('th[data-h]');
+    if (th !== testTipTarget) {
+        th ? showTestTooltip(th) : hideTestTooltip();
+    }
+});
+document.getElementById('dataTable').addEventListener('mouseleave', hideTooltips);
+document.getElementById('tableContainer').addEventListener('scroll', hideTooltips);
+window.addEventListener('resize', scheduleRenderWindow);
+
+// Restore saved filter state on page load
+restoreFilterState();
+
+// Set or clear one annotation bit of a cell in flagMatrix
+function setFlag(monitor, testName, flag, on) {
+    const k = monitor.row * allTests.length + testIndex.get(testName);
+    flagMatrix[k] = on ? (flagMatrix[k] | flag) : (flagMatrix[k] & ~flag);
+}
+
+// Re-apply CELL_STYLES to the rendered cells of one test (optionally one monitor) after an annotation change.
+// Annotations don't affect sort orders or pass/fail/timeout counts, so nothing else needs redrawing.
+function restyleCells(testName, monitor = null) {
+    const t = tableView.testsToShow.indexOf(testName);
+    const table = document.getElementById('dataTable');
+    if (t < tableView.colStart || t >= tableView.colEnd || !table.tBodies.length) return;
+
+    const j = testIndex.get(testName);
+    for (const tr of table.tBodies[0].querySelectorAll('tr[data-n]')) {
+        const m = tableView.data[+tr.dataset.n];
+        if (monitor && m !== monitor) continue;
+        const k = m.row * allTests.length + j;
+        const style = CELL_STYLES[cellState(k)];
+        const box = tr.querySelector(`td[data-t="${t}"]`).firstElementChild;
+        box.dataset.state = style.state;
+        box.textContent = style.sym;
+    }
+}
+
+// API call functions with in-place updates (no page reload)
+async function markAsResolved(netid, testName, resolved) {
+    try {
+        const response = await fetch('/api/mark_resolved', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({netid, test_name: testName, resolved})
+        });
+        const data = await response.json();
+        if (data.success) {
+            // Update in-memory data
+            const monitor = allData.find(m => m.netid === netid);
+            if (monitor) {
+                setFlag(monitor, testName, FLAG_RESOLVED, resolved);
+                if (resolved) {
+                    setFlag(monitor, testName, FLAG_TODO, false);
+                }
+            }
+
+            // Repaint just the affected cell
+            restyleCells(testName, monitor);
+
+            // Close modal and show success
+            closeDetailModal();
+            showToast(data.message, 'success');
+        } else {
+            showToast('Error: ' + data.message, 'error');
+        }
+    } catch (error) {
+        showToast('Network error: ' + error, 'error');
+    }
+}
+
+async function markAsTodo(netid, testName, todo) {
+    try {
+        const response = await fetch('/api/mark_todo', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({netid, test_name: testName, todo})
+        });
+        const data = await response.json();
+        if (data.success) {
+            // Update in-memory data
+            const monitor = allData.find(m => m.netid === netid);
+            if (monitor) {
+                setFlag(monitor, testName, FLAG_TODO, todo);
+                if (todo) {
+                    setFlag(monitor, testName, FLAG_RESOLVED, false);
+                }
+            }
+
+            // Repaint just the affected cell
+            restyleCells(testName, monitor);
+
+            // Close modal and show success
+            closeDetailModal();
+            showToast(data.message, 'success');
+        } else {
+            showToast('Error: ' + data.message, 'error');
+        }
+    } catch (error) {
+        showToast('Network error: ' + error, 'error');
+    }
+}
+
+function promptMarkTestAsInvalid(testName) {
+    const reason = prompt(`Mark "${testName}" as invalid for ALL monitors.\n\nPlease provide a reason:`);
+    if (reason !== null && reason.trim()) {
+        markTestAsInvalid(testName, true, reason.trim());
+    }
+}
+
+async function markTestAsInvalid(testName, invalid, reason = '') {
+    try {
+        const response = await fetch('/api/mark_invalid_test', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({test_name: testName, invalid, reason})
+        });
+        const data = await response.json();
+        if (data.success) {
+            // Update in-memory data for ALL monitors
+            if (invalid) {
+                invalidReasons[testName] = reason;
+            } else {
+                delete invalidReasons[testName];
+            }
+            allData.forEach(monitor => setFlag(monitor, testName, FLAG_INVALID, invalid));
+
+            // Repaint the test's column in the rendered rows
+            restyleCells(testName);
+
+            // Close modal and show success
+            closeDetailModal();
+            showToast(data.message, 'success');
+        } else {
+            showToast('Error: ' + data.message, 'error');
+        }
+    } catch (error) {
+        showToast('Network error: ' + error, 'error');
+    }
+}
+
+// Toast notification system
+function showToast(message, type = 'info') {
+    const toast = document.createElement('div');
+    const bgColor = type === 'success' ? 'bg-green-500' : type === 'error' ? 'bg-red-500' : 'bg-blue-500';
+
+    toast.className = `fixed top-4 right-4 ${bgColor} text-white px-6 py-3 rounded-lg shadow-lg z-50 transition-opacity duration-300`;
+    toast.textContent = message;
+
+    document.body.appendChild(toast);
+
+    // Fade out and remove after 3 seconds
+    setTimeout(() => {
+        toast.style.opacity = '0';
+        setTimeout(() => toast.remove(), 300);
+    }, 3000);
+}
+
+// Initial render once the data has loaded
+loadBootstrap().then(applyFilters).catch(error => {
+    document.getElementById('dataTable').innerHTML = `<tr><td class="text-center py-16 text-red-500 text-xl">${escapeHtml(error.message)}</td></tr>`;
+});
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test that web.py's compressed responses are encoded exactly once
+"""
+import gzip
+import json
+import os
+import sys
+
+# web.py reads its CSV and annotations relative to the working directory
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.getcwd())
+
+from fastapi.testclient import TestClient
+
+import web
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+PATHS = ['/', '/api/bootstrap', '/api/data', '/api/data?limit=20', '/api/data?layout=columns']
+
+
+def fetch_raw(client, path, encoding):
+    """Response and its body exactly as sent (the client would otherwise decode it)"""
+    with client.stream('GET', path, headers={'Accept-Encoding': encoding}) as response:
+        return response, b''.join(response.iter_raw())
+
+
+def decode_once(body, encoding):
+    """Undo a single Content-Encoding"""
+    if encoding == 'gzip':
+        return gzip.decompress(body)
+    if encoding == 'br':
+        return brotli.decompress(body)
+    assert encoding is None, f"unexpected Content-Encoding {encoding}"
+    return body
+
+
+def check_encoding(encoding):
+    with TestClient(web.app) as client:
+        # Twice each: the first /api/data is streamed, later ones are served from the cache
+        for path in PATHS + PATHS:
+            plain_response, plain = fetch_raw(client, path, 'identity')
+            assert plain_response.status_code == 200
+            assert 'content-encoding' not in plain_response.headers
+
+            response, body = fetch_raw(client, path, encoding)
+            assert response.status_code == 200
+            content_encoding = response.headers.get('content-encoding')
+            assert content_encoding in (encoding, None), f"{path}: {content_encoding}"
+            assert decode_once(body, content_encoding) == plain, f"{path} ({encoding}) not encoded exactly once"
+            if path.startswith('/api/data'):
+                json.loads(plain)
+
+
+def test_gzip():
+    """Every route decodes to the identity body after one gunzip"""
+    check_encoding('gzip')
+
+
+def test_brotli():
+    """Every route decodes to the identity body after one Brotli pass (or is sent plain)"""
+    if brotli is None:
+        print("brotli not installed, skipping")
+        return
+    check_encoding('br')
+
+
+if __name__ == '__main__':
+    test_gzip()
+    test_brotli()
+    print("OK")
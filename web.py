@@ -4,25 +4,330 @@ Data Visualizer Web Service
 Reads test_results_matrix.csv and provides sorting/filtering capabilities.
 Built with FastAPI and Tailwind CSS.
 """
+import asyncio
 import csv
+import gzip
+import hashlib
+import io
 import json
 import os
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 from typing import List, Dict, Optional
 from pydantic import BaseModel
+import numpy as np
 import uvicorn
 
-app = FastAPI(title="Test Results Data Visualizer")
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import watchfiles
+except ImportError:
+    watchfiles = None
+
+def encode_json(content):
+    """Compact JSON bytes, encoded with orjson when it is installed"""
+    if orjson is None:
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with orjson when it is installed"""
+    def render(self, content) -> bytes:
+        return encode_json(content)
+
+class ImmutableStaticFiles(StaticFiles):
+    """Static files referenced by content-hashed URLs, so browsers may cache them forever"""
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        return response
+
+class AcceptEncodingMiddleware:
+    """Rewrite Accept-Encoding to the bare list of codings it allows, so the compression
+    middleware (which only substring-matches the header) also honours q=0"""
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http':
+            headers = [(name, value) for name, value in scope['headers'] if name != b'accept-encoding']
+            if len(headers) != len(scope['headers']):
+                raw = b','.join(value for name, value in scope['headers'] if name == b'accept-encoding')
+                allowed = ', '.join(sorted(accepted_encodings(raw.decode('latin-1'))))
+                headers.append((b'accept-encoding', allowed.encode('latin-1')))
+                scope = dict(scope, headers=headers)
+        await self.app(scope, receive, send)
+
+# Routes that compress their own bodies (see negotiated_response). The compression middleware
+# never sees them, so nothing is encoded twice whether or not it skips encoded responses.
+PRECOMPRESSED_PATHS = frozenset({'/', '/api/bootstrap', '/api/data'})
+
+class CompressionMiddleware:
+    """Brotli (when brotli-asgi is installed) or gzip for every route outside PRECOMPRESSED_PATHS"""
+    def __init__(self, app):
+        self.app = app
+        if BrotliMiddleware is not None:
+            # Brotli for clients that accept br, gzip for the rest
+            self.compressed = BrotliMiddleware(app, quality=5, minimum_size=1024)
+        else:
+            self.compressed = GZipMiddleware(app, minimum_size=1024, compresslevel=6)
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http' and scope['path'] in PRECOMPRESSED_PATHS:
+            await self.app(scope, receive, send)
+        else:
+            await self.compressed(scope, receive, send)
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+@asynccontextmanager
+async def lifespan(app):
+    """Warm the matrix cache (and Numba kernel) at startup; flush pending annotations at shutdown"""
+    global _ANNOTATION_WRITER
+    # A fresh writer each run: the previous one was shut down with the last app
+    _ANNOTATION_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix='annotations')
+    load_matrix()
+    watcher = None
+    stop_watching = asyncio.Event()
+    if watchfiles is not None and os.path.isdir(os.path.dirname(os.path.abspath(CSV_PATH))):
+        watcher = asyncio.create_task(watch_matrix(stop_watching))
+    yield
+    if watcher is not None:
+        # Stopped through the event rather than cancelled, so watchfiles' own thread exits too
+        stop_watching.set()
+        await watcher
+    if _ANNOTATIONS_CACHE['retry'] is not None:
+        _ANNOTATIONS_CACHE['retry'].cancel()
+    if _ANNOTATIONS_CACHE['write_scheduled']:
+        # Queued behind any write still in flight, so the final state lands last
+        data = encode_annotations(_ANNOTATIONS_CACHE['annotations'])
+        await asyncio.get_running_loop().run_in_executor(_ANNOTATION_WRITER, write_annotations, data)
+    _ANNOTATION_WRITER.shutdown(wait=True)
+
+app = FastAPI(title="Test Results Data Visualizer", default_response_class=FastJSONResponse, lifespan=lifespan)
+app.add_middleware(CompressionMiddleware)
+# Added last so it runs first, ahead of the compression middleware
+app.add_middleware(AcceptEncodingMiddleware)
+app.mount("/static", ImmutableStaticFiles(directory=STATIC_DIR), name="static")
 
 CSV_PATH = "submit/result/test_results_matrix.csv"
 JSON_PATH = "submit/result/test_execution_logs.json"
+# Execution logs larger than this are streamed with ijson (when installed) rather than parsed whole
+STREAM_LOGS_MIN_SIZE = 50_000_000
+# The execution log fields the details view reads
+EXECUTION_LOG_FIELDS = ('netid', 'test_file', 'monitor_file', 'duration_seconds', 'exit_code',
+                        'error', 'stdout', 'stderr', 'start_time', 'end_time')
 VERIFICATION_PATH = "verification_results.json"
+VERIFICATION_JSONL_PATH = "batch_verification_output.jsonl"
 ANNOTATIONS_PATH = "test_annotations.json"
 
-def load_annotations():
-    """Load test annotations (resolved, TODO, invalid tests)"""
+# Status codes used in the uint8 result matrix (0 = missing status; any other unrecognised
+# string is STATUS_OTHER, with the string itself kept in matrix['rows'])
+STATUS_NA = 0
+STATUS_PASS = 1
+STATUS_FAIL = 2
+STATUS_TIMEOUT = 3
+STATUS_OTHER = 4
+STATUS_CODES = {'PASS': STATUS_PASS, 'FAIL': STATUS_FAIL, 'TIMEOUT': STATUS_TIMEOUT}
+
+# Annotation bits used in the uint8 flags matrix
+FLAG_RESOLVED = 1
+FLAG_TODO = 2
+FLAG_INVALID = 4
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Keys the page can sort monitors by; each gets a precomputed ascending order
+MONITOR_SORT_KEYS = ('netid', 'pass_count', 'fail_count', 'timeout_count')
+
+# Parsed CSV matrix, keyed on the CSV's mtime so we only re-parse when it changes;
+# 'watched' is set while watch_matrix() keeps it current, so requests skip the mtime check
+_MATRIX_CACHE = {'mtime': None, 'matrix': None, 'watched': False}
+
+# Row builder generated for the current CSV header, keyed on the test names
+_ROW_BUILDER_CACHE = {'key': None, 'builder': None}
+
+# Encoded /api/bootstrap payload, keyed on its ETag
+_BOOTSTRAP_CACHE = {'etag': None, 'body': None, 'variants': None, 'media_type': None}
+
+# Annotations as last read from (or written to) disk. While writes are pending the cached
+# copy is authoritative; 'stamp' changes whenever the annotations do, and 'retry' is the
+# task re-attempting a failed write.
+_ANNOTATIONS_CACHE = {'mtime': None, 'annotations': None, 'pending': 0, 'write_scheduled': False, 'stamp': 0,
+                      'retry': None}
+
+# Seconds to wait before writing annotations, so bursts of clicks become one write
+ANNOTATION_WRITE_DELAY = 0.2
+# Failed writes are retried, backing off up to this many seconds between attempts
+ANNOTATION_RETRY_MAX_DELAY = 30
+
+# Annotation writes run here, one at a time and in submission order (lifespan replaces
+# it at startup and shuts it down after the final flush)
+_ANNOTATION_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix='annotations')
+
+# load_data() output and its encoded (and compressed) /api/data body, keyed on the matrix
+# mtime and annotations stamp
+_DATA_CACHE = {'key': None, 'data': None, 'json': None, 'variants': None}
+
+# Monitors encoded per chunk when the records /api/data body is streamed
+DATA_STREAM_BATCH = 64
+
+# Encoded (and compressed) column-oriented /api/data body, under the same key
+_DATA_COLUMNS_CACHE = {'key': None, 'json': None, 'variants': None}
+
+# Execution logs and verification comments, keyed on their files' mtimes
+_EXECUTION_LOGS_CACHE = {'mtime': None, 'logs': None}
+_VERIFICATION_CACHE = {'mtimes': None, 'results': None}
+
+# Monitor/attack source text by path: {path: (mtime, text)}, least recently used first;
+# filled from asyncio.to_thread workers, so every access holds _SOURCE_CACHE_LOCK
+_SOURCE_CACHE = {}
+_SOURCE_CACHE_LOCK = threading.Lock()
+SOURCE_CACHE_SIZE = 4096
+
+def _file_mtime(path):
+    """Return a file's mtime in nanoseconds, or 0 if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+def _json_loads(raw):
+    """Parse JSON file bytes, with orjson when it is installed; invalid UTF-8 is replaced"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects invalid UTF-8 outright, so retry on the leniently decoded text
+            return orjson.loads(raw.decode('utf-8', errors='replace'))
+    return json.loads(raw.decode('utf-8', errors='replace'))
+
+def data_etag():
+    """ETag for responses derived from the loaded matrix and annotations"""
+    # Weak: the br, gzip and identity bodies share it
+    return f'W/"{_MATRIX_CACHE["mtime"]:x}-{_ANNOTATIONS_CACHE["stamp"]:x}"'
+
+def compress_body(body, brotli_quality=5):
+    """Precompressed variants of a cached response body, by Content-Encoding"""
+    variants = {'gzip': gzip.compress(body, compresslevel=6)}
+    if brotli is not None:
+        variants['br'] = brotli.compress(body, quality=brotli_quality)
+    return variants
+
+def accepted_encodings(header):
+    """Content codings an Accept-Encoding header allows (q=0 rules one out); '*' covers the rest"""
+    allowed = set()
+    refused = set()
+    for token in header.split(','):
+        coding, *params = [part.strip() for part in token.split(';')]
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        (allowed if q > 0 else refused).add(coding.lower())
+    if '*' in allowed:
+        allowed.update(encoding for encoding in ('br', 'gzip') if encoding not in refused)
+    return allowed
+
+def negotiated_response(request, body, variants, media_type, headers):
+    """Serve the best precompressed variant the client accepts (the middleware leaves it alone)"""
+    headers['Vary'] = 'Accept-Encoding'
+    accept = accepted_encodings(request.headers.get('accept-encoding', ''))
+    for encoding in ('br', 'gzip'):
+        if encoding in variants and encoding in accept:
+            headers['Content-Encoding'] = encoding
+            return Response(content=variants[encoding], media_type=media_type, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+def _reduce_status_numpy(status):
+    """Per-monitor pass/fail/timeout counts (NumPy fallback when Numba is missing)"""
+    return (
+        (status == STATUS_PASS).sum(axis=1, dtype=np.int32),
+        (status == STATUS_FAIL).sum(axis=1, dtype=np.int32),
+        (status == STATUS_TIMEOUT).sum(axis=1, dtype=np.int32),
+    )
+
+def column_counts(status, mask):
+    """Per-test pass/fail/timeout counts (rows of the result) over the monitors in mask"""
+    # Plain NumPy: summing axis 0 of the row-major matrix adds whole rows at a time, which
+    # measured faster than a Numba kernel walking it column by column
+    selected = status[mask]
+    return np.stack([
+        (selected == STATUS_PASS).sum(axis=0, dtype=np.int32),
+        (selected == STATUS_FAIL).sum(axis=0, dtype=np.int32),
+        (selected == STATUS_TIMEOUT).sum(axis=0, dtype=np.int32),
+    ])
+
+if njit is not None:
+    # Serial on purpose: the matrix is small, and a parallel kernel first run off the main thread
+    # (e.g. a test client's lifespan) starts Numba's thread pool there and hangs interpreter exit
+    @njit(cache=True)
+    def reduce_status(status):
+        """Per-monitor pass/fail/timeout counts over the (n_monitors, n_tests) matrix"""
+        n_monitors, n_tests = status.shape
+        pass_counts = np.zeros(n_monitors, dtype=np.int32)
+        fail_counts = np.zeros(n_monitors, dtype=np.int32)
+        timeout_counts = np.zeros(n_monitors, dtype=np.int32)
+        for i in range(n_monitors):
+            p = 0
+            f = 0
+            t = 0
+            for j in range(n_tests):
+                s = status[i, j]
+                p += int(s == STATUS_PASS)
+                f += int(s == STATUS_FAIL)
+                t += int(s == STATUS_TIMEOUT)
+            pass_counts[i] = p
+            fail_counts[i] = f
+            timeout_counts[i] = t
+        return pass_counts, fail_counts, timeout_counts
+else:
+    reduce_status = _reduce_status_numpy
+
+def read_annotations():
+    """Read test annotations (resolved, TODO, invalid tests) from disk"""
     if not Path(ANNOTATIONS_PATH).exists():
         return {
             'resolved': {},  # {(netid, test_name): True}
@@ -31,8 +336,8 @@ def load_annotations():
         }
     
     try:
-        with open(ANNOTATIONS_PATH, 'r') as f:
-            data = json.load(f)
+        with open(ANNOTATIONS_PATH, 'rb') as f:
+            data = _json_loads(f.read())
             # Convert string keys back to tuples for resolved/todo
             resolved = {tuple(k.split('|')): v for k, v in data.get('resolved', {}).items()}
             todo = {tuple(k.split('|')): v for k, v in data.get('todo', {}).items()}
@@ -45,15 +350,31 @@ def load_annotations():
         print(f"Warning: Could not load annotations: {e}")
         return {'resolved': {}, 'todo': {}, 'invalid_tests': {}}
 
-def save_annotations(annotations):
-    """Save test annotations to file"""
+def load_annotations():
+    """Cached annotations; re-read only when the file changed and no write is in flight"""
+    cache = _ANNOTATIONS_CACHE
+    mtime = _file_mtime(ANNOTATIONS_PATH)
+    if cache['annotations'] is not None and (cache['pending'] or cache['mtime'] == mtime):
+        return cache['annotations']
+    
+    cache['annotations'] = read_annotations()
+    cache['mtime'] = mtime
+    cache['stamp'] = time.time_ns()
+    return cache['annotations']
+
+def encode_annotations(annotations):
+    """Snapshot annotations into their JSON file form"""
+    # Convert tuple keys to strings for JSON serialization
+    return {
+        'resolved': {f"{k[0]}|{k[1]}": v for k, v in annotations['resolved'].items()},
+        'todo': {f"{k[0]}|{k[1]}": v for k, v in annotations['todo'].items()},
+        'invalid_tests': dict(annotations['invalid_tests'])
+    }
+
+def write_annotations(data):
+    """Write encoded annotations to file"""
     try:
-        # Convert tuple keys to strings for JSON serialization
-        data = {
-            'resolved': {f"{k[0]}|{k[1]}": v for k, v in annotations['resolved'].items()},
-            'todo': {f"{k[0]}|{k[1]}": v for k, v in annotations['todo'].items()},
-            'invalid_tests': annotations['invalid_tests']
-        }
+        # json.dump rather than orjson: it keeps the committed file's escaped non-ASCII text
         with open(ANNOTATIONS_PATH, 'w') as f:
             json.dump(data, f, indent=2)
         return True
@@ -61,24 +382,73 @@ def save_annotations(annotations):
         print(f"Error saving annotations: {e}")
         return False
 
+def save_annotations(annotations):
+    """Save test annotations to file"""
+    return write_annotations(encode_annotations(annotations))
+
+def schedule_annotations_write(background):
+    """Persist the (already updated) cached annotations after the response is sent.
+    Changes arriving within ANNOTATION_WRITE_DELAY share a single write."""
+    cache = _ANNOTATIONS_CACHE
+    cache['stamp'] = time.time_ns()
+    if cache['write_scheduled']:
+        return
+    cache['write_scheduled'] = True
+    cache['pending'] += 1
+    background.add_task(flush_annotations)
+
+async def flush_annotations(delay=ANNOTATION_WRITE_DELAY):
+    """Write the cached annotations to disk on the writer thread (re-scheduled if the write fails)"""
+    cache = _ANNOTATIONS_CACHE
+    try:
+        await asyncio.sleep(delay)
+        cache['write_scheduled'] = False
+        data = encode_annotations(cache['annotations'])  # Snapshot on the loop, before later requests mutate it
+        ok = await asyncio.get_running_loop().run_in_executor(_ANNOTATION_WRITER, write_annotations, data)
+    finally:
+        cache['pending'] -= 1
+    
+    if ok:
+        if not cache['pending']:
+            cache['mtime'] = _file_mtime(ANNOTATIONS_PATH)
+    elif not cache['write_scheduled']:
+        # The cached copy stays authoritative (the page already shows these edits): try again
+        # later, off the request that triggered the write, unless a newer flush is already queued
+        cache['write_scheduled'] = True
+        cache['pending'] += 1
+        cache['retry'] = asyncio.get_running_loop().create_task(
+            flush_annotations(min(delay * 2, ANNOTATION_RETRY_MAX_DELAY)))
+
 def load_verification_results():
-    """Load ChatGPT verification comments from JSON or JSONL"""
-    # Try JSON first (old format)
+    """Load verification comments (cached on the mtimes of both source files)"""
+    mtimes = (_file_mtime(VERIFICATION_PATH), _file_mtime(VERIFICATION_JSONL_PATH))
+    if _VERIFICATION_CACHE['mtimes'] == mtimes:
+        return _VERIFICATION_CACHE['results']
+    
+    results = read_verification_results()
+    _VERIFICATION_CACHE['mtimes'] = mtimes
+    _VERIFICATION_CACHE['results'] = results
+    return results
+
+def read_verification_results():
+    """Read ChatGPT verification comments from JSON or JSONL, keyed by test file name"""
+    # Try JSON first (old format, keyed without the .r2py suffix)
     if Path(VERIFICATION_PATH).exists():
         try:
-            with open(VERIFICATION_PATH, 'r') as f:
-                return json.load(f)
+            with open(VERIFICATION_PATH, 'rb') as f:
+                data = _json_loads(f.read())
+            return {k if k.endswith('.r2py') else k + '.r2py': v for k, v in data.items()}
         except Exception as e:
             print(f"Warning: Could not load verification_results.json: {e}")
     
     # Try JSONL format (batch output)
-    jsonl_path = "batch_verification_output.jsonl"
+    jsonl_path = VERIFICATION_JSONL_PATH
     if Path(jsonl_path).exists():
         try:
             results = {}
-            with open(jsonl_path, 'r') as f:
+            with open(jsonl_path, 'rb') as f:
                 for line in f:
-                    item = json.loads(line)
+                    item = _json_loads(line)
                     custom_id = item.get('custom_id')
                     if custom_id and item.get('response', {}).get('status_code') == 200:
                         content = item['response']['body']['choices'][0]['message']['content']
@@ -90,81 +460,374 @@ def load_verification_results():
     return {}
 
 def load_execution_logs():
-    """Load detailed execution logs from JSON"""
+    """Load detailed execution logs from JSON (cached on mtime)"""
+    mtime = _file_mtime(JSON_PATH)
+    if _EXECUTION_LOGS_CACHE['mtime'] == mtime:
+        return _EXECUTION_LOGS_CACHE['logs']
+    
+    logs = read_execution_logs()
+    _EXECUTION_LOGS_CACHE['mtime'] = mtime
+    _EXECUTION_LOGS_CACHE['logs'] = logs
+    return logs
+
+def read_execution_logs():
+    """Read detailed execution logs from JSON"""
     if not Path(JSON_PATH).exists():
         return {}
     
     try:
-        with open(JSON_PATH, 'r', encoding='utf-8', errors='replace') as f:
-            data = json.load(f)
-            executions = data.get('executions', [])
+        with open(JSON_PATH, 'rb') as f:
+            if ijson is not None and os.fstat(f.fileno()).st_size > STREAM_LOGS_MIN_SIZE:
+                # Stream the executions one at a time, keeping only the fields that are shown
+                executions = (
+                    {k: item[k] for k in EXECUTION_LOG_FIELDS if k in item}
+                    for item in ijson.items(f, 'executions.item', use_float=True)
+                )
+            else:
+                executions = _json_loads(f.read()).get('executions', [])
             
-            # Build a lookup dict: (netid, test_file) -> execution_info
+            # Build a nested lookup dict: netid -> test_file -> execution_info
             lookup = {}
             for exec_info in executions:
-                key = (exec_info.get('netid'), exec_info.get('test_file'))
-                lookup[key] = exec_info
+                lookup.setdefault(exec_info.get('netid'), {})[exec_info.get('test_file')] = exec_info
             
             return lookup
     except Exception as e:
         print(f"Warning: Could not load JSON logs: {e}")
         return {}
 
+def load_matrix():
+    """Parse the CSV into a uint8 status matrix plus per-monitor counts (cached on mtime)"""
+    if _MATRIX_CACHE['watched']:
+        return _MATRIX_CACHE['matrix']
+    
+    try:
+        mtime = os.stat(CSV_PATH).st_mtime_ns
+    except FileNotFoundError:
+        _MATRIX_CACHE['mtime'] = None
+        _MATRIX_CACHE['matrix'] = None
+        return None
+    
+    if _MATRIX_CACHE['mtime'] == mtime:
+        return _MATRIX_CACHE['matrix']
+    
+    # One bulk read, then parse from memory instead of line-by-line file reads
+    with open(CSV_PATH, 'r', encoding='utf-8', errors='replace', newline='') as f:
+        text = f.read()
+    
+    reader = csv.reader(io.StringIO(text, newline=''))
+    # First row: Monitor/NetID, Test1, Test2, ... (an empty file is an empty table)
+    headers = next(reader, None) or []
+    test_names = headers[1:]  # All test names
+    
+    # Rows share one str object per distinct status value instead of holding one per cell.
+    # Cells past the last test name have no column, so they are dropped here and neither
+    # the counts nor the totals include them.
+    interned = {}
+    netids = []
+    rows = []
+    for row in reader:
+        if not row:
+            continue
+        netids.append(row[0])
+        rows.append([interned.setdefault(value, value) for value in row[1:len(test_names) + 1]])
+    
+    # Dense (n_monitors, n_tests) matrix of status codes; short rows stay STATUS_NA
+    status = np.zeros((len(rows), len(test_names)), dtype=np.uint8)
+    for i, results in enumerate(rows):
+        status[i, :len(results)] = [STATUS_CODES.get(r, STATUS_OTHER if r else STATUS_NA) for r in results]
+    
+    pass_counts, fail_counts, timeout_counts = reduce_status(status)
+    
+    # Ascending monitor orderings for every sort option (descending = read backwards)
+    orders = {
+        'netid': np.array(sorted(range(len(netids)), key=lambda i: netids[i].lower()), dtype=np.int32),
+        'pass_count': np.argsort(pass_counts, kind='stable').astype(np.int32),
+        'fail_count': np.argsort(fail_counts, kind='stable').astype(np.int32),
+        'timeout_count': np.argsort(timeout_counts, kind='stable').astype(np.int32),
+    }
+    
+    matrix = {
+        'headers': headers,
+        'test_names': test_names,
+        'netids': netids,
+        'netid_index': {netid: i for i, netid in enumerate(netids)},
+        'test_index': {test_name: j for j, test_name in enumerate(test_names)},
+        'rows': rows,  # Raw status strings, kept for statuses outside STATUS_CODES
+        'status': status,
+        'pass_counts': pass_counts,
+        'fail_counts': fail_counts,
+        'timeout_counts': timeout_counts,
+        'totals': np.array([len(r) for r in rows], dtype=np.int32),  # Same truncated cells as the counts
+        'orders': orders,
+    }
+    _MATRIX_CACHE['mtime'] = mtime
+    _MATRIX_CACHE['matrix'] = matrix
+    return matrix
+
+async def watch_matrix(stop_event):
+    """Reload the matrix as soon as the CSV changes, so requests never stat it (needs watchfiles)"""
+    # Watch the directory rather than the file: the CSV may be replaced by a rename or not exist yet.
+    # Backends may report canonical paths (e.g. FSEvents through a symlinked submit/), so the
+    # directory is resolved and events are matched on the file name alone.
+    watch_dir = os.path.realpath(os.path.dirname(os.path.abspath(CSV_PATH)))
+    csv_name = os.path.basename(CSV_PATH)
+    # An empty batch every rust_timeout ms while idle; the first one means the watch is armed
+    changes = watchfiles.awatch(watch_dir, recursive=False,
+                                watch_filter=lambda change, path: os.path.basename(path) == csv_name,
+                                yield_on_timeout=True, rust_timeout=1000, stop_event=stop_event)
+    try:
+        async for _ in changes:
+            # Every batch, idle ones included, reloads through the mtime check: the first catches writes
+            # made before the watch was armed, and a change whose event was missed is still picked up
+            # at the next idle batch (one stat a second instead of one per request)
+            _MATRIX_CACHE['watched'] = False
+            try:
+                load_matrix()
+            except Exception as e:
+                # Requests go back to checking the mtime themselves until a reload succeeds
+                print(f"Warning: Could not reload {CSV_PATH}: {e}")
+                continue
+            _MATRIX_CACHE['watched'] = True
+    finally:
+        _MATRIX_CACHE['watched'] = False
+
+def build_annotation_flags(matrix, annotations):
+    """Overlay annotations onto a uint8 bit matrix aligned with matrix['status']"""
+    flags = np.zeros_like(matrix['status'])
+    netid_index = matrix['netid_index']
+    test_index = matrix['test_index']
+    
+    for name, bit in (('resolved', FLAG_RESOLVED), ('todo', FLAG_TODO)):
+        for key in annotations[name]:
+            i = netid_index.get(key[0])
+            j = test_index.get(key[-1])
+            if i is not None and j is not None:
+                flags[i, j] |= bit
+    
+    # Invalid tests apply to every monitor
+    for test_name in annotations['invalid_tests']:
+        j = test_index.get(test_name)
+        if j is not None:
+            flags[:, j] |= FLAG_INVALID
+    
+    return flags
+
+def build_other_statuses(matrix):
+    """[row-major cell index, raw status] for every STATUS_OTHER cell (the codes alone can't name them)"""
+    n_tests = len(matrix['test_names'])
+    rows = matrix['rows']
+    return [[int(k), rows[k // n_tests][k % n_tests]]
+            for k in np.flatnonzero(matrix['status'] == STATUS_OTHER)]
+
+def build_bootstrap(matrix, annotations):
+    """Encode the matrix as one columnar payload: Arrow IPC stream, or NDJSON without pyarrow"""
+    status = matrix['status']
+    flags = build_annotation_flags(matrix, annotations)
+    n_monitors, n_tests = status.shape
+    other_statuses = build_other_statuses(matrix)
+    
+    if pa is None:
+        # NDJSON the page can render progressively: a header line, then one line per monitor
+        # with its status codes / flag bits as digit strings ("1203...")
+        header = {
+            'test_names': matrix['test_names'],
+            'invalid_tests': annotations['invalid_tests'],
+            'other_statuses': other_statuses,
+            'n_monitors': n_monitors,
+            'orders': {key: matrix['orders'][key].tolist() for key in MONITOR_SORT_KEYS},
+        }
+        status_digits = (status + ord('0')).tobytes()
+        flag_digits = (flags + ord('0')).tobytes()
+        lines = [json.dumps(header, separators=(',', ':'))]
+        for i, netid in enumerate(matrix['netids']):
+            lines.append(json.dumps({
+                'netid': netid,
+                'pass_count': int(matrix['pass_counts'][i]),
+                'fail_count': int(matrix['fail_counts'][i]),
+                'timeout_count': int(matrix['timeout_counts'][i]),
+                'total': int(matrix['totals'][i]),
+                'status': status_digits[i * n_tests:(i + 1) * n_tests].decode('ascii'),
+                'flags': flag_digits[i * n_tests:(i + 1) * n_tests].decode('ascii'),
+            }, separators=(',', ':')))
+        return ('\n'.join(lines) + '\n').encode('utf-8'), NDJSON_MEDIA_TYPE
+    
+    # One row per monitor; each row's status/flags bytes form a fixed-size binary cell.
+    # The sort orders are monitor-length index arrays, so they ride along as columns.
+    row_type = pa.binary(n_tests)
+    columns = {
+        'netid': pa.array(matrix['netids'], type=pa.string()),
+        'pass_count': pa.array(matrix['pass_counts'], type=pa.int32()),
+        'fail_count': pa.array(matrix['fail_counts'], type=pa.int32()),
+        'timeout_count': pa.array(matrix['timeout_counts'], type=pa.int32()),
+        'total': pa.array(matrix['totals'], type=pa.int32()),
+        'status': pa.Array.from_buffers(row_type, n_monitors, [None, pa.py_buffer(status.tobytes())]),
+        'flags': pa.Array.from_buffers(row_type, n_monitors, [None, pa.py_buffer(flags.tobytes())]),
+    }
+    for key in MONITOR_SORT_KEYS:
+        columns[f'order_{key}'] = pa.array(matrix['orders'][key], type=pa.int32())
+    table = pa.table(columns, metadata={
+        'test_names': json.dumps(matrix['test_names']),
+        'invalid_tests': json.dumps(annotations['invalid_tests']),
+        'other_statuses': json.dumps(other_statuses),
+    })
+    
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes(), ARROW_STREAM_MEDIA_TYPE
+
+def build_results_dict(netid, results, test_names, resolved_get, todo_get, invalid):
+    """Generic per-monitor results dict, used for rows that don't match the header width"""
+    results_dict = {}
+    for test_name, result, (is_invalid_test, invalid_reason) in zip(test_names, results, invalid):
+        results_dict[test_name] = {
+            'status': result,
+            'is_resolved': resolved_get((netid, test_name), False),
+            'is_todo': todo_get((netid, test_name), False),
+            'is_invalid_test': is_invalid_test,
+            'invalid_reason': invalid_reason,
+            'netid': netid,
+            'test_name': test_name
+        }
+    return results_dict
+
+def get_row_builder(test_names):
+    """Return a results-dict builder specialized (via generated code) for this header"""
+    key = tuple(test_names)
+    if _ROW_BUILDER_CACHE['key'] == key:
+        return _ROW_BUILDER_CACHE['builder']
+    
+    # Unroll one dict entry per test with the test name as a literal and its column index fixed
+    lines = ["def build(netid, results, resolved_get, todo_get, invalid):", "    return {"]
+    for j, test_name in enumerate(test_names):
+        name = repr(test_name)
+        lines.append(
+            f"        {name}: {{'status': results[{j}], "
+            f"'is_resolved': resolved_get((netid, {name}), False), "
+            f"'is_todo': todo_get((netid, {name}), False), "
+            f"'is_invalid_test': invalid[{j}][0], 'invalid_reason': invalid[{j}][1], "
+            f"'netid': netid, 'test_name': {name}}},"
+        )
+    lines.append("    }")
+    
+    namespace = {}
+    exec(compile("\n".join(lines), "<row-builder>", "exec"), namespace)
+    builder = namespace['build']
+    
+    _ROW_BUILDER_CACHE['key'] = key
+    _ROW_BUILDER_CACHE['builder'] = builder
+    return builder
+
 def load_data():
     """Load CSV data and return structured data WITHOUT heavy execution details"""
-    if not Path(CSV_PATH).exists():
+    matrix = load_matrix()
+    if matrix is None:
         return None, [], [], {}
     
     # Load annotations (resolved, TODO, invalid tests)
     annotations = load_annotations()
     
+    key = (_MATRIX_CACHE['mtime'], _ANNOTATIONS_CACHE['stamp'])
+    if _DATA_CACHE['key'] != key:
+        _DATA_CACHE['data'] = build_data(matrix, annotations)
+        _DATA_CACHE['json'] = None
+        _DATA_CACHE['variants'] = None
+        _DATA_CACHE['key'] = key
+    return _DATA_CACHE['data']
+
+def iter_data_json(monitors_data, test_names):
+    """The records /api/data body in chunks: the test names, then a batch of monitors at a time"""
+    yield b'{"test_names":' + encode_json(test_names) + b',"monitors":['
+    for start in range(0, len(monitors_data), DATA_STREAM_BATCH):
+        batch = b','.join(encode_json(monitor) for monitor in monitors_data[start:start + DATA_STREAM_BATCH])
+        yield (b',' if start else b'') + batch
+    yield b']}'
+
+async def stream_data_json(monitors_data, test_names, gzipped=False):
+    """Stream a freshly built /api/data body (optionally gzipped on the fly), caching the
+    plain body once it has been sent in full"""
+    key = _DATA_CACHE['key']
+    chunks = []
+    # wbits=31 writes a gzip header and trailer around the deflate stream
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if gzipped else None
+    for chunk in iter_data_json(monitors_data, test_names):
+        chunks.append(chunk)
+        if compressor is None:
+            yield chunk
+        else:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        # Let other requests run between batches
+        await asyncio.sleep(0)
+    if compressor is not None:
+        yield compressor.flush()
+    if _DATA_CACHE['key'] == key and _DATA_CACHE['json'] is None:
+        _DATA_CACHE['json'] = b''.join(chunks)
+
+def load_data_columns_json():
+    """The column-oriented /api/data body, serialized once per matrix/annotations change"""
+    matrix = load_matrix()
+    if matrix is None:
+        return None
+    
+    annotations = load_annotations()
+    key = (_MATRIX_CACHE['mtime'], _ANNOTATIONS_CACHE['stamp'])
+    if _DATA_COLUMNS_CACHE['key'] != key:
+        _DATA_COLUMNS_CACHE['json'] = FastJSONResponse(build_data_columns(matrix, annotations)).body
+        _DATA_COLUMNS_CACHE['variants'] = None
+        _DATA_COLUMNS_CACHE['key'] = key
+    return _DATA_COLUMNS_CACHE['json']
+
+def build_data_columns(matrix, annotations):
+    """/api/data as one array per field (rows follow netids, columns follow test_names)"""
+    return {
+        'test_names': matrix['test_names'],
+        'netids': matrix['netids'],
+        'pass_count': matrix['pass_counts'].tolist(),
+        'fail_count': matrix['fail_counts'].tolist(),
+        'timeout_count': matrix['timeout_counts'].tolist(),
+        'total': matrix['totals'].tolist(),
+        'status': matrix['rows'],
+        'flags': build_annotation_flags(matrix, annotations).tolist(),
+        'invalid_tests': annotations['invalid_tests'],
+    }
+
+def build_data(matrix, annotations):
+    """Per-monitor results dicts for /api/data"""
     # Don't load execution logs or verification here - too heavy! Load on-demand.
     
-    with open(CSV_PATH, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.reader(f)
-        headers = next(reader)  # First row: Monitor/NetID, Test1, Test2, ...
-        test_names = headers[1:]  # All test names
+    test_names = matrix['test_names']
+    n_tests = len(test_names)
+    build_row = get_row_builder(test_names)
+    
+    # Annotation lookups bound once; invalid-test state is the same for every monitor
+    resolved_get = annotations['resolved'].get
+    todo_get = annotations['todo'].get
+    invalid_tests = annotations['invalid_tests']
+    invalid = [(test_name in invalid_tests, invalid_tests.get(test_name, '')) for test_name in test_names]
+    
+    monitors_data = []
+    for i, netid in enumerate(matrix['netids']):
+        results = matrix['rows'][i]
         
-        monitors_data = []
-        for row in reader:
-            netid = row[0]
-            results = row[1:]
-            
-            # Count pass/fail/timeout
-            pass_count = results.count("PASS")
-            fail_count = results.count("FAIL")
-            timeout_count = results.count("TIMEOUT")
-            total = len(results)
-            
-            # Build results dict with lightweight data (no logs/code/verification)
-            results_dict = {}
-            for test_name, result in zip(test_names, results):
-                # Check annotations
-                is_resolved = annotations['resolved'].get((netid, test_name), False)
-                is_todo = annotations['todo'].get((netid, test_name), False)
-                is_invalid_test = test_name in annotations['invalid_tests']
-                invalid_reason = annotations['invalid_tests'].get(test_name, '')
-                
-                results_dict[test_name] = {
-                    'status': result,
-                    'is_resolved': is_resolved,
-                    'is_todo': is_todo,
-                    'is_invalid_test': is_invalid_test,
-                    'invalid_reason': invalid_reason,
-                    'netid': netid,
-                    'test_name': test_name
-                }
-            
-            monitors_data.append({
-                'netid': netid,
-                'results': results_dict,
-                'pass_count': pass_count,
-                'fail_count': fail_count,
-                'timeout_count': timeout_count,
-                'total': total
-            })
+        # Build results dict with lightweight data (no logs/code/verification)
+        if len(results) >= n_tests:
+            results_dict = build_row(netid, results, resolved_get, todo_get, invalid)
+        else:
+            results_dict = build_results_dict(netid, results, test_names, resolved_get, todo_get, invalid)
+        
+        monitors_data.append({
+            'netid': netid,
+            'results': results_dict,
+            'pass_count': int(matrix['pass_counts'][i]),
+            'fail_count': int(matrix['fail_counts'][i]),
+            'timeout_count': int(matrix['timeout_counts'][i]),
+            'total': len(results)
+        })
     
-    return monitors_data, test_names, headers, annotations
+    return monitors_data, test_names, matrix['headers'], annotations
 
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -173,6 +836,8 @@ HTML_TEMPLATE = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Test Results Data Visualizer</title>
+    <!-- Start downloading the matrix now; app.js's fetch('/api/bootstrap') picks up this response -->
+    <link rel="preload" href="/api/bootstrap" as="fetch" crossorigin="anonymous">
     <script src="https://cdn.tailwindcss.com"></script>
     <script>
         tailwind.config = {
@@ -186,6 +851,24 @@ HTML_TEMPLATE = """
             }
         }
     </script>
+    <style>
+        /* Rows are virtualized in JS; containment keeps each cell's layout/paint local */
+        #tableContainer { contain: content; }
+        #dataTable tbody td { contain: layout paint; }
+        /* Long log/source blocks in the detail modal are skipped until scrolled to */
+        #modalContent pre { content-visibility: auto; contain-intrinsic-size: auto 24rem; }
+    </style>
+    <style type="text/tailwindcss">
+        /* Matrix cells: one class plus a data-state set from CELL_STYLES in app.js */
+        .cell { @apply rounded px-2 py-1 cursor-pointer transition font-bold bg-gray-200 text-gray-600; }
+        .cell[data-state="pass"] { @apply bg-green-500 hover:bg-green-600 text-white; }
+        .cell[data-state="timeout"] { @apply bg-blue-500 hover:bg-blue-600 text-white; }
+        .cell[data-state="fail"] { @apply bg-red-500 hover:bg-red-600 text-white; }
+        .cell[data-state="fail-resolved"] { @apply bg-blue-500 hover:bg-blue-600 text-white ring-2 ring-blue-300; }
+        .cell[data-state="fail-todo"] { @apply bg-orange-500 hover:bg-orange-600 text-white ring-2 ring-orange-300; }
+        .cell[data-state="other"] { @apply bg-gray-500 hover:bg-gray-600 text-white; }
+        .cell[data-state="invalid"] { @apply bg-yellow-400 hover:bg-yellow-500 text-gray-900; }
+    </style>
 </head>
 <body class="bg-gradient-to-br from-primary via-purple-600 to-secondary min-h-screen p-4 md:p-6">
     <!-- Detail Modal -->
@@ -313,6 +996,10 @@ HTML_TEMPLATE = """
                     <div class="bg-yellow-400 text-gray-900 rounded px-3 py-1 font-bold">⚠</div>
                     <span class="text-gray-700 font-medium">Invalid Test</span>
                 </div>
+                <div class="flex items-center gap-2">
+                    <div class="bg-gray-500 text-white rounded px-3 py-1 font-bold">?</div>
+                    <span class="text-gray-700 font-medium">Other Status</span>
+                </div>
                 <div class="h-6 w-px bg-gray-300"></div>
                 <div class="flex items-center gap-2">
                     <span class="text-gray-600 italic text-xs">💡 Hover for preview</span>
@@ -323,742 +1010,47 @@ HTML_TEMPLATE = """
             </div>
         </div>
         
-        <!-- Table Container -->
-        <div class="overflow-x-auto px-8 py-8">
+        <!-- Table Container (scrolls internally so only visible rows are rendered) -->
+        <div id="tableContainer" class="overflow-auto mx-8 my-8" style="max-height: 75vh;">
             <div class="inline-block min-w-full">
                 <table id="dataTable" class="border-collapse">
                     <!-- Table will be populated by JavaScript -->
                 </table>
             </div>
         </div>
+        
+        <!-- Row/cell templates cloned by the table renderer (kept free of whitespace nodes) -->
+        <template id="headRowTpl"><tr><th class="px-3 py-3 text-left text-xs font-semibold text-gray-700 cursor-pointer hover:bg-gray-200 transition border-r-4 border-gray-400">Monitor (hover for stats)</th></tr></template>
+        <template id="headCellTpl"><th class="px-1 py-3 text-center text-xs font-medium text-gray-600 border-r border-gray-200" style="width: 50px; min-width: 50px; max-width: 50px; writing-mode: vertical-rl; transform: rotate(180deg);"></th></template>
+        <template id="rowTpl"><tr class="hover:bg-gray-50 transition"><td data-label class="px-3 py-2 font-semibold text-primary font-mono border-r-4 border-gray-400 cursor-pointer"></td></tr></template>
+        <template id="cellTpl"><td class="px-1 py-2 text-center border-r border-gray-200"><div class="cell"></div></td></template>
+        <div id="monitorTip" class="hidden fixed z-50 bg-gray-900 text-white text-xs rounded-lg p-3 shadow-xl pointer-events-none" style="transform: translateY(-50%); min-width: 180px;"><div></div><div class="absolute top-1/2 right-full transform -translate-y-1/2 border-8 border-transparent border-r-gray-900"></div></div>
+        <div id="testTip" class="hidden fixed z-50 bg-gray-900 text-white text-xs rounded-lg p-3 shadow-xl pointer-events-none" style="transform: translateX(-50%); min-width: 200px;"></div>
+        <div id="cellTip" class="hidden fixed z-50 bg-gray-900 text-white text-xs rounded-lg p-3 shadow-xl pointer-events-none" style="transform: translate(-50%, -100%); min-width: 250px; max-width: 350px;"><div></div><div class="text-xs mt-2 pt-2 border-t border-gray-700 text-center italic">Click for full details</div><div class="absolute top-full left-1/2 transform -translate-x-1/2 border-8 border-transparent border-t-gray-900"></div></div>
     </div>
     
-    <script>
-        let allData = {{ data|tojson }};
-        let allTests = {{ tests|tojson }};
-        let currentData = [...allData];
-        
-        // Save/restore filter state from localStorage
-        function saveFilterState() {
-            const filterState = {
-                monitorFilter: document.getElementById('monitorFilter').value,
-                testFilter: document.getElementById('testFilter').value,
-                sortMonitorsBy: document.getElementById('sortMonitorsBy').value,
-                sortTestsBy: document.getElementById('sortTestsBy').value,
-                sortOrder: document.getElementById('sortOrder').value
-            };
-            localStorage.setItem('testVisualizerFilters', JSON.stringify(filterState));
-        }
-        
-        function restoreFilterState() {
-            const saved = localStorage.getItem('testVisualizerFilters');
-            if (saved) {
-                try {
-                    const filterState = JSON.parse(saved);
-                    document.getElementById('monitorFilter').value = filterState.monitorFilter || '';
-                    document.getElementById('testFilter').value = filterState.testFilter || '';
-                    document.getElementById('sortMonitorsBy').value = filterState.sortMonitorsBy || 'netid';
-                    document.getElementById('sortTestsBy').value = filterState.sortTestsBy || 'name';
-                    document.getElementById('sortOrder').value = filterState.sortOrder || 'desc';
-                } catch (e) {
-                    console.error('Failed to restore filter state:', e);
-                }
-            }
-        }
-        
-        async function openDetailModal(netid, testName, resultData) {
-            const modal = document.getElementById('detailModal');
-            const modalTitle = document.getElementById('modalTitle');
-            const modalContent = document.getElementById('modalContent');
-            
-            // Set title
-            modalTitle.textContent = `${netid} - ${testName}`;
-            
-            // Show loading state
-            modalContent.innerHTML = `
-                <div class="flex items-center justify-center py-16">
-                    <div class="text-center">
-                        <div class="text-6xl mb-4">⏳</div>
-                        <div class="text-xl text-gray-600">Loading details...</div>
-                    </div>
-                </div>
-            `;
-            
-            // Show modal immediately
-            modal.classList.remove('hidden');
-            document.body.style.overflow = 'hidden';
-            
-            // Fetch detailed data from API
-            try {
-                const response = await fetch(`/api/test_details/${encodeURIComponent(netid)}/${encodeURIComponent(testName)}`);
-                if (!response.ok) {
-                    throw new Error('Failed to load details');
-                }
-                const details = await response.json();
-                
-                // Build content with loaded data
-                const status = resultData ? resultData.status : 'N/A';
-                const duration = details.duration ? details.duration.toFixed(3) : 'N/A';
-                const exitCode = details.exit_code !== null ? details.exit_code : 'N/A';
-                const error = details.error ? details.error : 'None';
-                const stdout = details.stdout ? details.stdout : '(empty)';
-                const startTime = details.start_time ? formatTime(details.start_time) : 'N/A';
-                const endTime = details.end_time ? formatTime(details.end_time) : 'N/A';
-                const verification = details.verification || '';
-            
-            // Determine status color and icon
-            let statusClass = 'bg-gray-100 text-gray-700';
-            let statusIcon = '?';
-            if (status === 'PASS') {
-                statusClass = 'bg-green-100 text-green-700 border-l-4 border-green-500';
-                statusIcon = '✓';
-            } else if (status === 'FAIL') {
-                statusClass = 'bg-red-100 text-red-700 border-l-4 border-red-500';
-                statusIcon = '✗';
-            } else if (status === 'TIMEOUT') {
-                statusClass = 'bg-orange-100 text-orange-700 border-l-4 border-orange-500';
-                statusIcon = '⏱';
-            }
-            
-            modalContent.innerHTML = `
-                <div class="space-y-6">
-                    <!-- Status Banner -->
-                    <div class="${statusClass} rounded-lg p-4">
-                        <div class="flex items-center gap-3">
-                            <span class="text-4xl">${statusIcon}</span>
-                            <div>
-                                <h3 class="text-2xl font-bold">${status}</h3>
-                                <p class="text-sm opacity-75">Test execution status</p>
-                            </div>
-                        </div>
-                    </div>
-                    
-                    <!-- Execution Details Grid -->
-                    <div class="grid grid-cols-1 md:grid-cols-2 gap-4">
-                        <div class="bg-gray-50 rounded-lg p-4">
-                            <h4 class="text-xs font-semibold text-gray-500 uppercase mb-1">Monitor (NetID)</h4>
-                            <p class="text-lg font-mono font-bold text-primary">${netid}</p>
-                        </div>
-                        
-                        <div class="bg-gray-50 rounded-lg p-4">
-                            <h4 class="text-xs font-semibold text-gray-500 uppercase mb-1">Test Case</h4>
-                            <p class="text-lg font-semibold text-gray-700">${testName}</p>
-                        </div>
-                        
-                        <div class="bg-gray-50 rounded-lg p-4">
-                            <h4 class="text-xs font-semibold text-gray-500 uppercase mb-1">Duration</h4>
-                            <p class="text-2xl font-bold text-blue-600">${duration}s</p>
-                        </div>
-                        
-                        <div class="bg-gray-50 rounded-lg p-4">
-                            <h4 class="text-xs font-semibold text-gray-500 uppercase mb-1">Exit Code</h4>
-                            <p class="text-2xl font-bold text-gray-700">${exitCode}</p>
-                        </div>
-                        
-                        <div class="bg-gray-50 rounded-lg p-4">
-                            <h4 class="text-xs font-semibold text-gray-500 uppercase mb-1">Start Time</h4>
-                            <p class="text-sm text-gray-700">${startTime}</p>
-                        </div>
-                        
-                        <div class="bg-gray-50 rounded-lg p-4">
-                            <h4 class="text-xs font-semibold text-gray-500 uppercase mb-1">End Time</h4>
-                            <p class="text-sm text-gray-700">${endTime}</p>
-                        </div>
-                    </div>
-                    
-                    <!-- Error Message -->
-                    ${error !== 'None' ? `
-                    <div class="bg-red-50 border-l-4 border-red-500 rounded-lg p-4">
-                        <h4 class="text-sm font-semibold text-red-700 uppercase mb-2">Error Message</h4>
-                        <pre class="text-sm text-red-900 whitespace-pre-wrap font-mono bg-white rounded p-3 overflow-x-auto">${escapeHtml(error)}</pre>
-                    </div>
-                    ` : ''}
-                    
-                    <!-- ChatGPT Verification Comment -->
-                    ${verification ? `
-                    <div class="bg-purple-50 border-l-4 border-purple-500 rounded-lg p-4">
-                        <div class="flex items-center gap-2 mb-3">
-                            <span class="text-2xl">🤖</span>
-                            <h4 class="text-sm font-semibold text-purple-700 uppercase">ChatGPT Verification Analysis</h4>
-                        </div>
-                        <div class="text-sm text-gray-800 whitespace-pre-wrap bg-white rounded p-4 overflow-x-auto max-h-96 leading-relaxed">${escapeHtml(verification)}</div>
-                    </div>
-                    ` : ''}
-                    
-                    <!-- Standard Output -->
-                    <div class="bg-blue-50 border-l-4 border-blue-500 rounded-lg p-4">
-                        <h4 class="text-sm font-semibold text-blue-700 uppercase mb-2">Standard Output</h4>
-                        <pre class="text-sm text-gray-800 whitespace-pre-wrap font-mono bg-white rounded p-3 overflow-x-auto max-h-96">${escapeHtml(stdout)}</pre>
-                    </div>
-
-                    <!-- Reference Monitor Source -->
-                    <div class="bg-gray-50 border-l-4 border-gray-500 rounded-lg p-4">
-                        <h4 class="text-sm font-semibold text-gray-700 uppercase mb-2">Reference Monitor Source</h4>
-                        <div class="text-xs text-gray-500 mb-2">${details.monitor_path ? escapeHtml(details.monitor_path) : 'Path: N/A'}</div>
-                        <pre class="text-xs text-gray-800 whitespace-pre-wrap font-mono bg-white rounded p-3 overflow-x-auto max-h-96">${escapeHtml(details.monitor_code || 'N/A')}</pre>
-                    </div>
-
-                    <!-- Attack Test Source -->
-                    <div class="bg-gray-50 border-l-4 border-gray-500 rounded-lg p-4">
-                        <h4 class="text-sm font-semibold text-gray-700 uppercase mb-2">Attack Test Source</h4>
-                        <div class="text-xs text-gray-500 mb-2">${details.attack_path ? escapeHtml(details.attack_path) : 'Path: N/A'}</div>
-                        <pre class="text-xs text-gray-800 whitespace-pre-wrap font-mono bg-white rounded p-3 overflow-x-auto max-h-96">${escapeHtml(details.attack_code || 'N/A')}</pre>
-                    </div>
-                    
-                    <!-- Actions -->
-                    <div class="space-y-4">
-                        <!-- Annotation Actions (only show for failed tests, not timeouts) -->
-                        ${status === 'FAIL' && !resultData.is_invalid_test ? `
-                        <div class="bg-gray-100 rounded-lg p-4">
-                            <h4 class="text-sm font-semibold text-gray-700 mb-3">Mark as:</h4>
-                            <div class="flex gap-3 flex-wrap">
-                                <button onclick="markAsResolved('${netid}', '${testName}', ${!resultData.is_resolved})" 
-                                        class="px-4 py-2 ${resultData.is_resolved ? 'bg-gray-400' : 'bg-blue-500 hover:bg-blue-600'} text-white font-semibold rounded-lg transition">
-                                    ${resultData.is_resolved ? '✓ Resolved' : 'Mark Resolved'}
-                                </button>
-                                <button onclick="markAsTodo('${netid}', '${testName}', ${!resultData.is_todo})" 
-                                        class="px-4 py-2 ${resultData.is_todo ? 'bg-gray-400' : 'bg-orange-500 hover:bg-orange-600'} text-white font-semibold rounded-lg transition">
-                                    ${resultData.is_todo ? '📌 TODO' : 'Mark TODO'}
-                                </button>
-                            </div>
-                        </div>
-                        ` : ''}
-                        
-                        <!-- Invalid Test Action -->
-                        <div class="bg-gray-100 rounded-lg p-4">
-                            <h4 class="text-sm font-semibold text-gray-700 mb-3">Test Validity:</h4>
-                            ${resultData.is_invalid_test ? `
-                                <div class="mb-3">
-                                    <div class="text-sm text-yellow-700 bg-yellow-50 rounded p-3 mb-2">
-                                        <strong>⚠ Invalid Test</strong><br>
-                                        Reason: ${escapeHtml(resultData.invalid_reason || 'No reason provided')}
-                                    </div>
-                                    <button onclick="markTestAsInvalid('${testName}', false)" 
-                                            class="px-4 py-2 bg-green-500 hover:bg-green-600 text-white font-semibold rounded-lg transition">
-                                        Mark as Valid
-                                    </button>
-                                </div>
-                            ` : `
-                                <button onclick="promptMarkTestAsInvalid('${testName}')" 
-                                        class="px-4 py-2 bg-yellow-500 hover:bg-yellow-600 text-white font-semibold rounded-lg transition">
-                                    Mark Entire Test as Invalid
-                                </button>
-                            `}
-                        </div>
-                        
-                        <!-- Close Button -->
-                        <div class="flex justify-end">
-                            <button onclick="closeDetailModal()" class="px-6 py-2 bg-gray-500 hover:bg-gray-600 text-white font-semibold rounded-lg transition">
-                                Close
-                            </button>
-                        </div>
-                    </div>
-                </div>
-            `;
-            } catch (error) {
-                // Show error state
-                modalContent.innerHTML = `
-                    <div class="flex items-center justify-center py-16">
-                        <div class="text-center">
-                            <div class="text-6xl mb-4">❌</div>
-                            <div class="text-xl text-red-600 mb-4">Failed to load details</div>
-                            <div class="text-sm text-gray-600">${escapeHtml(error.message)}</div>
-                            <button onclick="closeDetailModal()" class="mt-6 px-6 py-2 bg-gray-500 hover:bg-gray-600 text-white font-semibold rounded-lg transition">
-                                Close
-                            </button>
-                        </div>
-                    </div>
-                `;
-            }
-        }
-        
-        function closeDetailModal(event) {
-            // Only close if clicking outside the modal or close button
-            if (!event || event.target.id === 'detailModal' || event.type === 'undefined') {
-                const modal = document.getElementById('detailModal');
-                modal.classList.add('hidden');
-                document.body.style.overflow = 'auto';
-            }
-        }
-        
-        // Close modal on Escape key
-        document.addEventListener('keydown', function(event) {
-            if (event.key === 'Escape') {
-                closeDetailModal();
-            }
-        });
-        
-        function updateStats(data) {
-            const totalMonitors = data.length;
-            const totalPass = data.reduce((sum, m) => sum + m.pass_count, 0);
-            const totalFail = data.reduce((sum, m) => sum + m.fail_count, 0);
-            const totalTimeout = data.reduce((sum, m) => sum + m.timeout_count, 0);
-            
-            document.getElementById('stats').innerHTML = `
-                <div class="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-4 gap-6">
-                    <div class="bg-blue-50 rounded-xl p-6 border-l-4 border-blue-500 shadow-sm hover:shadow-md transition-shadow">
-                        <div class="text-xs font-semibold text-gray-600 uppercase tracking-wide mb-2">Monitors</div>
-                        <div class="text-4xl font-bold text-blue-600">${totalMonitors}</div>
-                    </div>
-                    <div class="bg-green-50 rounded-xl p-6 border-l-4 border-green-500 shadow-sm hover:shadow-md transition-shadow">
-                        <div class="text-xs font-semibold text-gray-600 uppercase tracking-wide mb-2">Total Passes</div>
-                        <div class="text-4xl font-bold text-green-600">${totalPass}</div>
-                    </div>
-                    <div class="bg-red-50 rounded-xl p-6 border-l-4 border-red-500 shadow-sm hover:shadow-md transition-shadow">
-                        <div class="text-xs font-semibold text-gray-600 uppercase tracking-wide mb-2">Total Failures</div>
-                        <div class="text-4xl font-bold text-red-600">${totalFail}</div>
-                    </div>
-                    <div class="bg-orange-50 rounded-xl p-6 border-l-4 border-orange-500 shadow-sm hover:shadow-md transition-shadow">
-                        <div class="text-xs font-semibold text-gray-600 uppercase tracking-wide mb-2">Total Timeouts</div>
-                        <div class="text-4xl font-bold text-orange-600">${totalTimeout}</div>
-                    </div>
-                </div>
-            `;
-        }
-        
-        function formatDuration(seconds) {
-            if (!seconds) return 'N/A';
-            return seconds.toFixed(2) + 's';
-        }
-        
-        function formatTime(isoString) {
-            if (!isoString) return 'N/A';
-            const date = new Date(isoString);
-            return date.toLocaleString();
-        }
-        
-        function escapeHtml(text) {
-            if (!text) return '';
-            return text.replace(/&/g, '&amp;')
-                       .replace(/</g, '&lt;')
-                       .replace(/>/g, '&gt;')
-                       .replace(/"/g, '&quot;')
-                       .replace(/'/g, '&#039;');
-        }
-        
-        function calculateTestStats(data, testsToShow) {
-            // Calculate stats for each test
-            const testStats = {};
-            testsToShow.forEach(test => {
-                let passCount = 0;
-                let failCount = 0;
-                let timeoutCount = 0;
-                
-                data.forEach(monitor => {
-                    const result = monitor.results[test];
-                    if (result) {
-                        if (result.status === 'PASS') passCount++;
-                        else if (result.status === 'TIMEOUT') timeoutCount++;
-                        else if (result.status === 'FAIL') failCount++;
-                    }
-                });
-                
-                testStats[test] = {
-                    pass_count: passCount,
-                    fail_count: failCount,
-                    timeout_count: timeoutCount,
-                    total: data.length
-                };
-            });
-            
-            return testStats;
-        }
-        
-        function sortTests(testsToShow, data, sortBy, sortOrder) {
-            const testStats = calculateTestStats(data, testsToShow);
-            
-            if (sortBy === 'name') {
-                // Already sorted by name
-                return testsToShow;
-            }
-            
-            const sorted = [...testsToShow].sort((a, b) => {
-                const statA = testStats[a][sortBy] || 0;
-                const statB = testStats[b][sortBy] || 0;
-                
-                if (sortOrder === 'desc') {
-                    return statB - statA;
-                } else {
-                    return statA - statB;
-                }
-            });
-            
-            return sorted;
-        }
-        
-        function updateTable(data, testFilter = '', sortTestsBy = 'name', sortOrder = 'desc') {
-            const table = document.getElementById('dataTable');
-            
-            if (data.length === 0) {
-                table.innerHTML = '<tr><td class="text-center py-16 text-gray-400 text-xl" colspan="10">No data matches your filters</td></tr>';
-                return;
-            }
-            
-            // Filter tests if test filter is applied
-            let testsToShow = allTests;
-            if (testFilter) {
-                testsToShow = allTests.filter(t => t.toLowerCase().includes(testFilter.toLowerCase()));
-            }
-            
-            // Sort tests if needed
-            testsToShow = sortTests(testsToShow, data, sortTestsBy, sortOrder);
-            
-            // Calculate test stats for tooltips
-            const testStats = calculateTestStats(data, testsToShow);
-            
-            // Build table header - always show all tests
-            let headerHTML = '<thead class="bg-gray-100 sticky top-0"><tr>';
-            headerHTML += '<th class="px-3 py-3 text-left text-xs font-semibold text-gray-700 cursor-pointer hover:bg-gray-200 transition border-r-4 border-gray-400">Monitor (hover for stats)</th>';
-            
-            // Always show all tests
-            testsToShow.forEach(test => {
-                const shortName = test.replace('.r2py', '').replace('test', 't');
-                const stats = testStats[test];
-                headerHTML += `<th class="px-1 py-3 text-center text-xs font-medium text-gray-600 border-r border-gray-200 relative group" style="min-width: 50px; writing-mode: vertical-rl; transform: rotate(180deg);" title="${test}">
-                    ${shortName}
-                    <div class="hidden group-hover:block absolute z-50 bg-gray-900 text-white text-xs rounded-lg p-3 shadow-xl" 
-                         style="left: 50%; transform: translateX(-50%) rotate(180deg); writing-mode: horizontal-tb; top: 100%; margin-top: 8px; min-width: 200px;">
-                        <strong>${test}</strong><br>
-                        Pass: ${stats.pass_count}<br>
-                        Fail: ${stats.fail_count}<br>
-                        Timeout: ${stats.timeout_count}<br>
-                        Total: ${stats.total}
-                    </div>
-                </th>`;
-            });
-            
-            headerHTML += '</tr></thead>';
-            
-            // Build table body
-            let bodyHTML = '<tbody class="divide-y divide-gray-200 text-xs">';
-            data.forEach(monitor => {
-                // Build NetID cell with hover tooltip
-                const netidTooltip = `
-                    <strong>Monitor: ${monitor.netid}</strong><br>
-                    <span class="text-green-400">✓ Pass: ${monitor.pass_count}</span><br>
-                    <span class="text-red-400">✗ Fail: ${monitor.fail_count}</span><br>
-                    <span class="text-orange-400">⏱ Timeout: ${monitor.timeout_count}</span><br>
-                    <strong>Total: ${monitor.total}</strong>
-                `;
-                
-                bodyHTML += `<tr class="hover:bg-gray-50 transition">`;
-                bodyHTML += `<td class="px-3 py-2 font-semibold text-primary font-mono border-r-4 border-gray-400 relative group cursor-pointer">
-                    ${monitor.netid}
-                    <div class="hidden group-hover:block absolute z-50 bg-gray-900 text-white text-xs rounded-lg p-3 shadow-xl" 
-                         style="left: 100%; margin-left: 8px; top: 50%; transform: translateY(-50%); min-width: 180px;">
-                        ${netidTooltip}
-                        <div class="absolute top-1/2 right-full transform -translate-y-1/2 border-8 border-transparent border-r-gray-900"></div>
-                    </div>
-                </td>`;
-                
-                // Show all tests as matrix cells
-                testsToShow.forEach(test => {
-                    const resultData = monitor.results[test];
-                    const status = resultData ? resultData.status : 'N/A';
-                    
-                    // Check annotation states
-                    const isInvalidTest = resultData && resultData.is_invalid_test;
-                    const isResolved = resultData && resultData.is_resolved;
-                    const isTodo = resultData && resultData.is_todo;
-                    
-                    // Determine colors based on status and annotations
-                    let bgClass = 'bg-gray-200';
-                    let textClass = 'text-gray-600';
-                    let symbol = '?';
-                    let borderClass = '';
-                    
-                    // If test is invalid, always show yellow regardless of PASS/FAIL
-                    if (isInvalidTest) {
-                        bgClass = 'bg-yellow-400 hover:bg-yellow-500';
-                        textClass = 'text-gray-900';
-                        symbol = '⚠';
-                    } else if (status === 'PASS') {
-                        bgClass = 'bg-green-500 hover:bg-green-600';
-                        textClass = 'text-white';
-                        symbol = '✓';
-                    } else if (status === 'TIMEOUT') {
-                        // Timeouts show blue by default (expected behavior)
-                        bgClass = 'bg-blue-500 hover:bg-blue-600';
-                        textClass = 'text-white';
-                        symbol = '⏱';
-                    } else if (status === 'FAIL') {
-                        // Failed tests - check if resolved or TODO
-                        if (isResolved) {
-                            bgClass = 'bg-blue-500 hover:bg-blue-600';
-                            textClass = 'text-white';
-                            symbol = '✓';
-                            borderClass = 'ring-2 ring-blue-300';
-                        } else if (isTodo) {
-                            bgClass = 'bg-orange-500 hover:bg-orange-600';
-                            textClass = 'text-white';
-                            symbol = '📌';
-                            borderClass = 'ring-2 ring-orange-300';
-                        } else {
-                            bgClass = 'bg-red-500 hover:bg-red-600';
-                            textClass = 'text-white';
-                            symbol = '✗';
-                        }
-                    }
-                    
-                    // Build tooltip content with test name, monitor name, and status type
-                    let tooltipHTML = '';
-                    if (resultData) {
-                        // Header with test and monitor info
-                        tooltipHTML = `<div class="font-bold text-yellow-300 mb-2">📋 ${test}</div>`;
-                        tooltipHTML += `<div class="text-xs text-gray-300 mb-2">Monitor: ${monitor.netid}</div>`;
-                        tooltipHTML += `<div class="border-t border-gray-700 pt-2 mb-2"></div>`;
-                        
-                        // Status with color and description
-                        let statusDisplay = '';
-                        if (status === 'PASS') {
-                            statusDisplay = '<span class="text-green-400 font-bold">✓ PASS</span>';
-                        } else if (status === 'FAIL') {
-                            if (isResolved) {
-                                statusDisplay = '<span class="text-blue-400 font-bold">✓ FAIL (Resolved)</span>';
-                            } else if (isTodo) {
-                                statusDisplay = '<span class="text-orange-400 font-bold">📌 FAIL (TODO)</span>';
-                            } else {
-                                statusDisplay = '<span class="text-red-400 font-bold">✗ FAIL</span>';
-                            }
-                        } else if (status === 'TIMEOUT') {
-                            statusDisplay = '<span class="text-blue-400 font-bold">⏱ TIMEOUT</span>';
-                        } else {
-                            statusDisplay = `<span class="text-gray-400">${status}</span>`;
-                        }
-                        
-                        tooltipHTML += `Status: ${statusDisplay}<br>`;
-                        
-                        // Invalid test warning
-                        if (isInvalidTest) {
-                            tooltipHTML += `<div class="bg-yellow-600 text-white px-2 py-1 rounded text-xs mt-1 mb-1">⚠ Invalid Test</div>`;
-                        }
-                    } else {
-                        tooltipHTML = `<div class="font-bold text-yellow-300">${test}</div>`;
-                        tooltipHTML += `<div class="text-xs text-gray-300">Monitor: ${monitor.netid}</div>`;
-                        tooltipHTML += `<div class="text-gray-400 mt-2">No data available</div>`;
-                    }
-                    
-                    // Store minimal data as JSON string in data attribute
-                    const cellData = JSON.stringify({
-                        status: status,
-                        is_resolved: resultData?.is_resolved || false,
-                        is_todo: resultData?.is_todo || false,
-                        is_invalid_test: resultData?.is_invalid_test || false,
-                        invalid_reason: resultData?.invalid_reason || ''
-                    });
-                    
-                    bodyHTML += `<td class="px-1 py-2 text-center border-r border-gray-200">
-                        <div class="${bgClass} ${textClass} ${borderClass} rounded px-2 py-1 cursor-pointer transition font-bold relative group"
-                             title="${status} (click for details)"
-                             onclick='openDetailModal("${monitor.netid}", "${test}", ${cellData})'>
-                            ${symbol}
-                            <div class="hidden group-hover:block absolute z-50 bg-gray-900 text-white text-xs rounded-lg p-3 shadow-xl pointer-events-none" 
-                                 style="left: 50%; transform: translateX(-50%); bottom: 100%; margin-bottom: 8px; min-width: 250px; max-width: 350px;">
-                                ${tooltipHTML}
-                                <div class="text-xs mt-2 pt-2 border-t border-gray-700 text-center italic">Click for full details</div>
-                                <div class="absolute top-full left-1/2 transform -translate-x-1/2 border-8 border-transparent border-t-gray-900"></div>
-                            </div>
-                        </div>
-                    </td>`;
-                });
-                
-                bodyHTML += `</tr>`;
-            });
-            bodyHTML += '</tbody>';
-            
-            table.innerHTML = headerHTML + bodyHTML;
-        }
-        
-        function applyFilters() {
-            const monitorFilter = document.getElementById('monitorFilter').value.toLowerCase();
-            const testFilter = document.getElementById('testFilter').value.toLowerCase();
-            const sortMonitorsBy = document.getElementById('sortMonitorsBy').value;
-            const sortTestsBy = document.getElementById('sortTestsBy').value;
-            const sortOrder = document.getElementById('sortOrder').value;
-            
-            // Save filter state to localStorage
-            saveFilterState();
-            
-            // Filter by monitor
-            let filtered = allData.filter(m => {
-                if (monitorFilter && !m.netid.toLowerCase().includes(monitorFilter)) {
-                    return false;
-                }
-                
-                // Filter by test (check if any test matching the filter has results)
-                if (testFilter) {
-                    const matchingTests = allTests.filter(t => t.toLowerCase().includes(testFilter));
-                    if (matchingTests.length === 0) return false;
-                }
-                
-                return true;
-            });
-            
-            // Sort monitors
-            filtered.sort((a, b) => {
-                let valA = a[sortMonitorsBy];
-                let valB = b[sortMonitorsBy];
-                
-                if (typeof valA === 'string') {
-                    valA = valA.toLowerCase();
-                    valB = valB.toLowerCase();
-                }
-                
-                if (sortOrder === 'asc') {
-                    return valA > valB ? 1 : -1;
-                } else {
-                    return valA < valB ? 1 : -1;
-                }
-            });
-            
-            currentData = filtered;
-            updateStats(filtered);
-            updateTable(filtered, testFilter, sortTestsBy, sortOrder);
-        }
-        
-        // Event listeners
-        document.getElementById('monitorFilter').addEventListener('input', applyFilters);
-        document.getElementById('testFilter').addEventListener('input', applyFilters);
-        document.getElementById('sortMonitorsBy').addEventListener('change', applyFilters);
-        document.getElementById('sortTestsBy').addEventListener('change', applyFilters);
-        document.getElementById('sortOrder').addEventListener('change', applyFilters);
-        
-        // Restore saved filter state on page load
-        restoreFilterState();
-        
-        // API call functions with in-place updates (no page reload)
-        async function markAsResolved(netid, testName, resolved) {
-            try {
-                const response = await fetch('/api/mark_resolved', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({netid, test_name: testName, resolved})
-                });
-                const data = await response.json();
-                if (data.success) {
-                    // Update in-memory data
-                    const monitor = allData.find(m => m.netid === netid);
-                    if (monitor && monitor.results[testName]) {
-                        monitor.results[testName].is_resolved = resolved;
-                        if (resolved) {
-                            monitor.results[testName].is_todo = false;
-                        }
-                    }
-                    
-                    // Re-render table without page reload
-                    applyFilters();
-                    
-                    // Close modal and show success
-                    closeDetailModal();
-                    showToast(data.message, 'success');
-                } else {
-                    showToast('Error: ' + data.message, 'error');
-                }
-            } catch (error) {
-                showToast('Network error: ' + error, 'error');
-            }
-        }
-        
-        async function markAsTodo(netid, testName, todo) {
-            try {
-                const response = await fetch('/api/mark_todo', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({netid, test_name: testName, todo})
-                });
-                const data = await response.json();
-                if (data.success) {
-                    // Update in-memory data
-                    const monitor = allData.find(m => m.netid === netid);
-                    if (monitor && monitor.results[testName]) {
-                        monitor.results[testName].is_todo = todo;
-                        if (todo) {
-                            monitor.results[testName].is_resolved = false;
-                        }
-                    }
-                    
-                    // Re-render table without page reload
-                    applyFilters();
-                    
-                    // Close modal and show success
-                    closeDetailModal();
-                    showToast(data.message, 'success');
-                } else {
-                    showToast('Error: ' + data.message, 'error');
-                }
-            } catch (error) {
-                showToast('Network error: ' + error, 'error');
-            }
-        }
-        
-        function promptMarkTestAsInvalid(testName) {
-            const reason = prompt(`Mark "${testName}" as invalid for ALL monitors.\\n\\nPlease provide a reason:`);
-            if (reason !== null && reason.trim()) {
-                markTestAsInvalid(testName, true, reason.trim());
-            }
-        }
-        
-        async function markTestAsInvalid(testName, invalid, reason = '') {
-            try {
-                const response = await fetch('/api/mark_invalid_test', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({test_name: testName, invalid, reason})
-                });
-                const data = await response.json();
-                if (data.success) {
-                    // Update in-memory data for ALL monitors
-                    allData.forEach(monitor => {
-                        if (monitor.results[testName]) {
-                            monitor.results[testName].is_invalid_test = invalid;
-                            monitor.results[testName].invalid_reason = reason;
-                        }
-                    });
-                    
-                    // Re-render table without page reload
-                    applyFilters();
-                    
-                    // Close modal and show success
-                    closeDetailModal();
-                    showToast(data.message, 'success');
-                } else {
-                    showToast('Error: ' + data.message, 'error');
-                }
-            } catch (error) {
-                showToast('Network error: ' + error, 'error');
-            }
-        }
-        
-        // Toast notification system
-        function showToast(message, type = 'info') {
-            const toast = document.createElement('div');
-            const bgColor = type === 'success' ? 'bg-green-500' : type === 'error' ? 'bg-red-500' : 'bg-blue-500';
-            
-            toast.className = `fixed top-4 right-4 ${bgColor} text-white px-6 py-3 rounded-lg shadow-lg z-50 transition-opacity duration-300`;
-            toast.textContent = message;
-            
-            document.body.appendChild(toast);
-            
-            // Fade out and remove after 3 seconds
-            setTimeout(() => {
-                toast.style.opacity = '0';
-                setTimeout(() => toast.remove(), 300);
-            }, 3000);
-        }
-        
-        // Initial render
-        applyFilters();
-    </script>
+    <script src="/static/app.js?v={{ app_js_version }}"></script>
 </body>
 </html>
 """
 
+# The page is static (data comes from /api/bootstrap), so it is encoded once at import.
+# app.js is versioned by content hash so it can be cached as immutable.
+APP_JS_VERSION = hashlib.sha256((STATIC_DIR / "app.js").read_bytes()).hexdigest()[:12]
+HTML_BYTES = HTML_TEMPLATE.replace('{{ app_js_version }}', APP_JS_VERSION).encode('utf-8')
+HTML_VARIANTS = compress_body(HTML_BYTES, brotli_quality=11)
+HTML_ETAG = f'W/"{hashlib.sha256(HTML_BYTES).hexdigest()[:16]}"'
+
 @app.get("/", response_class=HTMLResponse)
-async def index():
-    """Main page showing the data table"""
-    monitors_data, test_names, headers, annotations = load_data()
-    
-    if monitors_data is None:
+async def index(request: Request):
+    """Main page showing the data table (data is fetched from /api/bootstrap)"""
+    # Only check that the CSV exists (no stat while the watcher keeps the matrix current);
+    # parsing it is left to /api/bootstrap
+    if _MATRIX_CACHE['watched']:
+        csv_exists = _MATRIX_CACHE['matrix'] is not None
+    else:
+        csv_exists = bool(_file_mtime(CSV_PATH))
+    if not csv_exists:
         return """
         <!DOCTYPE html>
         <html>
@@ -1079,24 +1071,105 @@ async def index():
         </html>
         """
     
-    # Use simple string replacement for data injection
-    html = HTML_TEMPLATE.replace('{{ data|tojson }}', json.dumps(monitors_data))
-    html = html.replace('{{ tests|tojson }}', json.dumps(test_names))
-    
-    return html
+    headers = {'ETag': HTML_ETAG, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+    if request.headers.get('if-none-match') == HTML_ETAG:
+        return Response(status_code=304, headers=headers)
+    return negotiated_response(request, HTML_BYTES, HTML_VARIANTS, "text/html; charset=utf-8", headers)
 
 @app.get("/api/data")
-async def api_data():
-    """API endpoint to get raw data as JSON"""
-    monitors_data, test_names, headers, annotations = load_data()
+async def api_data(request: Request, layout: str = 'records', offset: int = 0, limit: Optional[int] = None,
+                   q: str = ''):
+    """API endpoint to get raw data as JSON (per-monitor records, or layout=columns)"""
+    if layout not in ('records', 'columns'):
+        raise HTTPException(status_code=400, detail="layout must be 'records' or 'columns'")
+    
+    paged = offset != 0 or limit is not None or q != ''
+    if paged and layout != 'records':
+        raise HTTPException(status_code=400, detail="offset, limit and q apply to layout=records only")
+    if offset < 0 or (limit is not None and limit < 1):
+        raise HTTPException(status_code=400, detail="offset must be >= 0 and limit >= 1")
     
-    if monitors_data is None:
+    if load_matrix() is None:
         raise HTTPException(status_code=404, detail="CSV file not found")
     
-    return {
-        'monitors': monitors_data,
-        'test_names': test_names
-    }
+    # Revalidated before anything is built, so an unchanged reload costs no body at all
+    load_annotations()
+    etag = data_etag()
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers=headers)
+    
+    if paged:
+        # One page of the records, netids matched like the page's monitor filter
+        monitors_data, test_names = load_data()[:2]
+        needle = q.lower()
+        matched = [monitor for monitor in monitors_data if needle in monitor['netid'].lower()]
+        end = len(matched) if limit is None else offset + limit
+        body = encode_json({'test_names': test_names, 'monitors': matched[offset:end], 'total': len(matched)})
+        # Pages change with every query, so they are compressed per request
+        return negotiated_response(request, body, compress_body(body) if len(body) >= 1024 else {},
+                                   "application/json", headers)
+    
+    if layout == 'records':
+        monitors_data, test_names = load_data()[:2]
+        if _DATA_CACHE['json'] is None:
+            # First request since the data changed: stream it rather than encode it all up front
+            headers['Vary'] = 'Accept-Encoding'
+            gzipped = 'gzip' in accepted_encodings(request.headers.get('accept-encoding', ''))
+            if gzipped:
+                headers['Content-Encoding'] = 'gzip'
+            return StreamingResponse(stream_data_json(monitors_data, test_names, gzipped),
+                                     media_type="application/json", headers=headers)
+        body, cache = _DATA_CACHE['json'], _DATA_CACHE
+    else:
+        body, cache = load_data_columns_json(), _DATA_COLUMNS_CACHE
+    
+    # Compressed once per data change, not by the middleware on every request
+    if cache['variants'] is None:
+        cache['variants'] = compress_body(body)
+    return negotiated_response(request, body, cache['variants'], "application/json", headers)
+
+@app.get("/api/stats")
+async def api_stats(monitor: str = ''):
+    """Per-test pass/fail/timeout counts over the monitors whose netid contains `monitor`"""
+    matrix = load_matrix()
+    
+    if matrix is None:
+        raise HTTPException(status_code=404, detail="CSV file not found")
+    
+    # Same case-insensitive substring match as the page's monitor filter
+    needle = monitor.lower()
+    mask = np.fromiter((needle in netid.lower() for netid in matrix['netids']), dtype=np.bool_, count=len(matrix['netids']))
+    counts = column_counts(matrix['status'], mask)
+    # Returned as a response so FastAPI skips its jsonable_encoder walk over the count lists
+    return FastJSONResponse({
+        'test_names': matrix['test_names'],
+        'monitors': int(mask.sum()),
+        'pass_count': counts[0].tolist(),
+        'fail_count': counts[1].tolist(),
+        'timeout_count': counts[2].tolist(),
+    })
+
+@app.get("/api/bootstrap", response_class=Response)
+async def api_bootstrap(request: Request):
+    """Columnar matrix + annotation flags the page boots from (ETag-keyed, precompressed)"""
+    matrix = load_matrix()
+    
+    if matrix is None:
+        raise HTTPException(status_code=404, detail="CSV file not found")
+    
+    annotations = load_annotations()
+    etag = data_etag()
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers=headers)
+    
+    if _BOOTSTRAP_CACHE['etag'] != etag:
+        body, media_type = build_bootstrap(matrix, annotations)
+        _BOOTSTRAP_CACHE.update(etag=etag, body=body, variants=compress_body(body), media_type=media_type)
+    
+    return negotiated_response(request, _BOOTSTRAP_CACHE['body'], _BOOTSTRAP_CACHE['variants'],
+                               _BOOTSTRAP_CACHE['media_type'], headers)
 
 class MarkResolvedRequest(BaseModel):
     netid: str
@@ -1114,7 +1187,7 @@ class MarkInvalidTestRequest(BaseModel):
     reason: str = ""
 
 @app.post("/api/mark_resolved")
-async def mark_resolved(request: MarkResolvedRequest):
+async def mark_resolved(request: MarkResolvedRequest, background: BackgroundTasks):
     """Mark a test result as resolved or unresolved"""
     annotations = load_annotations()
     key = (request.netid, request.test_name)
@@ -1126,13 +1199,11 @@ async def mark_resolved(request: MarkResolvedRequest):
     else:
         annotations['resolved'].pop(key, None)
     
-    if save_annotations(annotations):
-        return {"success": True, "message": f"Marked {request.netid}/{request.test_name} as {'resolved' if request.resolved else 'unresolved'}"}
-    else:
-        raise HTTPException(status_code=500, detail="Failed to save annotations")
+    schedule_annotations_write(background)
+    return {"success": True, "message": f"Marked {request.netid}/{request.test_name} as {'resolved' if request.resolved else 'unresolved'}"}
 
 @app.post("/api/mark_todo")
-async def mark_todo(request: MarkTodoRequest):
+async def mark_todo(request: MarkTodoRequest, background: BackgroundTasks):
     """Mark a test result as TODO or remove TODO"""
     annotations = load_annotations()
     key = (request.netid, request.test_name)
@@ -1144,13 +1215,11 @@ async def mark_todo(request: MarkTodoRequest):
     else:
         annotations['todo'].pop(key, None)
     
-    if save_annotations(annotations):
-        return {"success": True, "message": f"Marked {request.netid}/{request.test_name} as {'TODO' if request.todo else 'not TODO'}"}
-    else:
-        raise HTTPException(status_code=500, detail="Failed to save annotations")
+    schedule_annotations_write(background)
+    return {"success": True, "message": f"Marked {request.netid}/{request.test_name} as {'TODO' if request.todo else 'not TODO'}"}
 
 @app.post("/api/mark_invalid_test")
-async def mark_invalid_test(request: MarkInvalidTestRequest):
+async def mark_invalid_test(request: MarkInvalidTestRequest, background: BackgroundTasks):
     """Mark an entire test as invalid (affects all monitors)"""
     annotations = load_annotations()
     
@@ -1161,64 +1230,72 @@ async def mark_invalid_test(request: MarkInvalidTestRequest):
     else:
         annotations['invalid_tests'].pop(request.test_name, None)
     
-    if save_annotations(annotations):
-        return {"success": True, "message": f"Marked {request.test_name} as {'invalid' if request.invalid else 'valid'}"}
-    else:
-        raise HTTPException(status_code=500, detail="Failed to save annotations")
+    schedule_annotations_write(background)
+    return {"success": True, "message": f"Marked {request.test_name} as {'invalid' if request.invalid else 'valid'}"}
 
 @app.get("/api/annotations")
 async def get_annotations():
     """Get all annotations"""
     annotations = load_annotations()
     # Convert tuple keys to strings for JSON
-    return {
+    return FastJSONResponse({
         'resolved': [f"{k[0]}|{k[1]}" for k in annotations['resolved'].keys()],
         'todo': [f"{k[0]}|{k[1]}" for k in annotations['todo'].keys()],
         'invalid_tests': annotations['invalid_tests']
-    }
+    })
 
-@app.get("/api/test_details/{netid}/{test_name}")
-async def get_test_details(netid: str, test_name: str):
-    """Load detailed execution info, logs, and source code on-demand"""
-    # Load execution logs
-    execution_logs = load_execution_logs()
-    exec_info = execution_logs.get((netid, test_name), {})
+def read_source_file(path):
+    """Source text of a monitor/attack file, None if missing, or the read error as text"""
+    if path is None:
+        return None
+    mtime = _file_mtime(path)
+    with _SOURCE_CACHE_LOCK:
+        cached = _SOURCE_CACHE.pop(path, None)
+        if not mtime:
+            return None
+        if cached is not None and cached[0] == mtime:
+            _SOURCE_CACHE[path] = cached  # Re-insert as most recently used
+            return cached[1]
     
+    # Read outside the lock so slow files don't hold up other lookups
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            text = f.read()
+    except Exception as e:
+        return f"Error reading file: {e}"
+    with _SOURCE_CACHE_LOCK:
+        _SOURCE_CACHE[path] = (mtime, text)
+        if len(_SOURCE_CACHE) > SOURCE_CACHE_SIZE:
+            _SOURCE_CACHE.pop(next(iter(_SOURCE_CACHE)))
+    return text
+
+def get_exec_info(netid, test_name):
+    """Execution log entry for one monitor/test pair (404 if it never ran)"""
+    exec_info = load_execution_logs().get(netid, {}).get(test_name)
     if not exec_info:
         raise HTTPException(status_code=404, detail="Test execution not found")
-    
-    # Derive file paths
+    return exec_info
+
+def source_paths(exec_info):
+    """Monitor and attack source paths for an execution log entry"""
     monitor_filename = exec_info.get('monitor_file')
     test_filename = exec_info.get('test_file')
     
-    monitor_path = None
-    test_path = None
-    monitor_code = None
-    attack_code = None
-    
-    if monitor_filename:
-        monitor_path = os.path.join('submit', 'reference_monitor', monitor_filename)
-        try:
-            if os.path.exists(monitor_path):
-                with open(monitor_path, 'r', encoding='utf-8', errors='replace') as mf:
-                    monitor_code = mf.read()
-        except Exception as e:
-            monitor_code = f"Error reading file: {e}"
-    
-    if test_filename:
-        test_path = os.path.join('submit', 'general_tests', test_filename)
-        try:
-            if os.path.exists(test_path):
-                with open(test_path, 'r', encoding='utf-8', errors='replace') as tf:
-                    attack_code = tf.read()
-        except Exception as e:
-            attack_code = f"Error reading file: {e}"
+    monitor_path = os.path.join('submit', 'reference_monitor', monitor_filename) if monitor_filename else None
+    test_path = os.path.join('submit', 'general_tests', test_filename) if test_filename else None
+    return monitor_path, test_path
+
+@app.get("/api/test_details/{netid}/{test_name}")
+async def get_test_details(netid: str, test_name: str):
+    """Load detailed execution info and logs on-demand (sources come from /api/source)"""
+    exec_info = get_exec_info(netid, test_name)
+    monitor_path, test_path = source_paths(exec_info)
     
     # Load verification result on-demand
     verification_results = load_verification_results()
-    verification = verification_results.get(test_name.rstrip('.r2py'), '')
+    verification = verification_results.get(test_name, '')
     
-    return {
+    return FastJSONResponse({
         'duration': exec_info.get('duration_seconds'),
         'exit_code': exec_info.get('exit_code'),
         'error': exec_info.get('error'),
@@ -1228,10 +1305,20 @@ async def get_test_details(netid: str, test_name: str):
         'end_time': exec_info.get('end_time'),
         'monitor_path': monitor_path,
         'attack_path': test_path,
-        'monitor_code': monitor_code,
-        'attack_code': attack_code,
         'verification': verification
-    }
+    })
+
+@app.get("/api/source/{netid}/{test_name}")
+async def get_source(netid: str, test_name: str):
+    """Monitor and attack source text for the details modal, fetched alongside the logs"""
+    monitor_path, test_path = source_paths(get_exec_info(netid, test_name))
+    
+    # Read both source files concurrently, off the event loop
+    monitor_code, attack_code = await asyncio.gather(
+        asyncio.to_thread(read_source_file, monitor_path),
+        asyncio.to_thread(read_source_file, test_path),
+    )
+    return FastJSONResponse({'monitor_code': monitor_code, 'attack_code': attack_code})
 
 if __name__ == '__main__':
     HOST = "0.0.0.0"    
@@ -1243,6 +1330,8 @@ if __name__ == '__main__':
     print(f"Starting web server on http://localhost:{PORT}")
     print("Press Ctrl+C to stop")
     print("=" * 80)
-    uvicorn.run(app, host=HOST, port=PORT)
+    # uvicorn picks uvloop and httptools itself when they are installed (uvicorn[standard]).
+    # One worker only: annotations live in this process's memory and are flushed from it.
+    uvicorn.run(app, host=HOST, port=PORT, access_log=False)
 
 